@@ -0,0 +1,123 @@
+"""Load test: DB tool throughput as concurrent callers grow.
+
+Usage:
+    python bench_concurrency.py [--rows 300000] [--calls 64] [--concurrency 1,2,4,8]
+
+Drives the offloaded tools from one asyncio loop, the way `call_mcp_tool`
+does, and reports calls per second for each concurrency level. A second
+run keeps slow scans saturated and measures the latency of primary key
+lookups issued alongside them. The query cache is disabled so every call
+runs its scan.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+
+async def _run_callers(call, calls: int, concurrency: int) -> float:
+    remaining = iter(range(calls))
+
+    async def caller() -> None:
+        for _ in remaining:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def _lookup_latency_under_load(
+    executor, db, slow_query, lookups: int
+) -> list[float]:
+    lookup = executor.offload(db.get_table_schema)
+    stop = asyncio.Event()
+
+    async def slow_caller() -> None:
+        while not stop.is_set():
+            await slow_query()
+
+    slow_callers = [
+        asyncio.create_task(slow_caller()) for _ in range(executor.max_workers)
+    ]
+    await asyncio.sleep(0.1)
+    latencies = []
+    for _ in range(lookups):
+        start = time.perf_counter()
+        await lookup("todos")
+        latencies.append(time.perf_counter() - start)
+    stop.set()
+    await asyncio.gather(*slow_callers)
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--calls", type=int, default=64)
+    parser.add_argument("--concurrency", default="1,2,4,8")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp_dir, "bench.db")
+        os.environ["SQLITE_POOL_SIZE"] = str(max(levels))
+        os.environ["SQLITE_QUERY_CACHE_MAX_BYTES"] = "0"
+        os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+
+        # Imported late so every module picks up the benchmark database path
+        import db
+        from init_db import init_database
+        from tool_executor import ToolExecutor
+
+        init_database()
+        with db.get_db_pool().connection() as conn:
+            conn.executemany(
+                "INSERT INTO todos (user_id, task, completed) VALUES (?, ?, ?)",
+                (
+                    (i % 3 + 1, f"Synthetic task number {i}", i % 2)
+                    for i in range(args.rows)
+                ),
+            )
+            conn.commit()
+
+        unlimited = ToolExecutor(max_workers=max(levels), concurrency_limits={})
+        scan = unlimited.offload(db.query_db_table)
+
+        def slow_query():
+            return scan("todos", "COUNT(*) AS matches", "task LIKE '%99%'")
+
+        print(f"{'callers':>8} {'seconds':>9} {'calls/s':>9}")
+        for concurrency in levels:
+            elapsed = await _run_callers(slow_query, args.calls, concurrency)
+            print(f"{concurrency:>8} {elapsed:>9.2f} {args.calls / elapsed:>9.1f}")
+        unlimited.shutdown()
+
+        print(
+            "\nget_table_schema latency while query_db_table scans saturate the pool:"
+        )
+        for label, limits in (("no limits", {}), ("default limits", None)):
+            executor = ToolExecutor(max_workers=max(levels), concurrency_limits=limits)
+            limited_scan = executor.offload(db.query_db_table)
+            latencies = await _lookup_latency_under_load(
+                executor,
+                db,
+                lambda: limited_scan(
+                    "todos", "COUNT(*) AS matches", "task LIKE '%99%'"
+                ),
+                lookups=20,
+            )
+            executor.shutdown()
+            print(
+                f"  {label:>15}: p50 {statistics.median(latencies) * 1e3:.2f} ms, "
+                f"max {max(latencies) * 1e3:.2f} ms"
+            )
+
+        db.close_db_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""Benchmark: bytes and encode time of the pretty and compact response formats.
+
+Usage:
+    python bench_encoding.py [--rows 10,100,1000,10000] [--repeat 50]
+
+Encodes `query_db_table`-shaped results of todo rows in both formats.
+"""
+
+import argparse
+import time
+
+from response_encoding import (
+    RESPONSE_FORMAT_COMPACT,
+    RESPONSE_FORMAT_PRETTY,
+    encode_tool_response,
+)
+
+
+def _todo_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "user_id": i % 3 + 1,
+            "task": f"Synthetic task number {i}",
+            "completed": i % 2,
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="10,100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'format':>8} {'bytes':>10} {'us/encode':>10}")
+    for count in (int(rows) for rows in args.rows.split(",")):
+        rows = _todo_rows(count)
+        for response_format in (RESPONSE_FORMAT_PRETTY, RESPONSE_FORMAT_COMPACT):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                text = encode_tool_response(rows, response_format)
+            elapsed = (time.perf_counter() - start) / args.repeat
+            print(
+                f"{count:>7} {response_format:>8} {len(text.encode('utf-8')):>10} {elapsed * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
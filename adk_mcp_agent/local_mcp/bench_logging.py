@@ -0,0 +1,117 @@
+"""Benchmark: logging overhead per tool call, before and after queued logging.
+
+Usage:
+    python bench_logging.py [--rows 1000] [--calls 2000]
+
+Each mode runs in its own process, since logging configuration is global:
+  none    - logging disabled, the baseline tool cost
+  before  - DEBUG level, synchronous FileHandler, full response f-string
+  after   - `configure_logging` queue handler with size-capped payloads
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _run_mode(mode: str, rows: int, calls: int, tmp_dir: str) -> float:
+    os.environ["SQLITE_DB_PATH"] = os.path.join(tmp_dir, f"{mode}.db")
+    os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+    log_file_path = os.path.join(tmp_dir, f"{mode}.log")
+
+    # Imported late so every module picks up the benchmark database path
+    import db
+    from init_db import init_database
+    from log_config import LogPayload, configure_logging, stop_logging
+
+    init_database()
+    db.insert_many(
+        "todos",
+        [
+            {"user_id": i % 3 + 1, "task": f"Synthetic task {i}", "completed": i % 2}
+            for i in range(rows)
+        ],
+    )
+
+    if mode == "before":
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
+            handlers=[logging.FileHandler(log_file_path, mode="w")],
+            force=True,
+        )
+    elif mode == "after":
+        configure_logging(log_file_path)
+    else:
+        logging.disable(logging.CRITICAL)
+
+    arguments = {"table_name": "todos", "columns": "*", "condition": ""}
+    start = time.perf_counter()
+    for _ in range(calls):
+        if mode == "before":
+            logging.info(
+                f"MCP Server: Received call_tool request for 'query_db_table' with args: {arguments}"
+            )
+        else:
+            logging.info(
+                "MCP Server: Received call_tool request for '%s' with args: %s",
+                "query_db_table",
+                LogPayload(arguments),
+            )
+        response = db.query_db_table(**arguments)
+        if mode == "before":
+            logging.info(
+                f"MCP Server: ADK tool 'query_db_table' executed. Response: {response}"
+            )
+        else:
+            logging.info(
+                "MCP Server: ADK tool '%s' executed. Response: %s",
+                "query_db_table",
+                LogPayload(response),
+            )
+    elapsed = time.perf_counter() - start
+    if mode == "after":
+        stop_logging()
+    return elapsed / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--mode", choices=["none", "before", "after"])
+    args = parser.parse_args()
+
+    if args.mode:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sys.stdout = open(os.devnull, "w")
+            per_call = _run_mode(args.mode, args.rows, args.calls, tmp_dir)
+            sys.stdout = sys.__stdout__
+            print(per_call)
+        return
+
+    results = {}
+    for mode in ("none", "before", "after"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode]
+            + ["--rows", str(args.rows), "--calls", str(args.calls)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[mode] = float(output.stdout.strip().splitlines()[-1])
+
+    print(f"rows per response: {args.rows}, calls: {args.calls}")
+    for mode, per_call in results.items():
+        overhead = per_call - results["none"]
+        print(
+            f"{mode:>7}: {per_call * 1e6:>9.1f} us/call  (logging overhead {overhead * 1e6:>9.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
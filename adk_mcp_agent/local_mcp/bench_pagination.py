@@ -0,0 +1,87 @@
+"""Benchmark: peak server memory of paginated reads as the table grows.
+
+Usage:
+    python bench_pagination.py [--sizes 250000,1000000,2000000] [--page-size 500] [--fetchall]
+
+Grows a throwaway `todos` table to each size, walks it end to end with
+`query_db_table_page` and reports the peak traced allocation. With
+`--fetchall` the unpaginated `query_db_table` is measured alongside.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+
+def _grow_todos(conn, start: int, stop: int) -> None:
+    conn.executemany(
+        "INSERT INTO todos (user_id, task, completed) VALUES (?, ?, ?)",
+        ((i % 3 + 1, f"Synthetic task number {i}", i % 2) for i in range(start, stop)),
+    )
+    conn.commit()
+
+
+def _walk_pages(db, page_size: int) -> int:
+    rows_seen = 0
+    page_token = ""
+    while True:
+        page = db.query_db_table_page("todos", "*", "", "id", page_size, page_token)
+        rows_seen += page["count"]
+        page_token = page["next_page_token"]
+        if not page_token:
+            return rows_seen
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="250000,1000000,2000000")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--fetchall", action="store_true")
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp_dir, "bench.db")
+        os.environ["SQLITE_MAX_PAGE_SIZE"] = str(args.page_size)
+        os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+
+        # Imported late so both modules pick up the benchmark database path
+        import db
+        from init_db import init_database
+
+        init_database()
+
+        print(f"{'rows':>10} {'mode':>9} {'seconds':>9} {'peak MiB':>9}")
+        current = 5
+        for size in sizes:
+            with db.get_db_pool().connection() as conn:
+                _grow_todos(conn, current, size)
+            current = size
+
+            rows_seen, elapsed, peak = _measure(lambda: _walk_pages(db, args.page_size))
+            assert rows_seen == size, (rows_seen, size)
+            print(f"{size:>10} {'paged':>9} {elapsed:>9.2f} {peak / 2**20:>9.2f}")
+
+            if args.fetchall:
+                _, elapsed, peak = _measure(lambda: db.query_db_table("todos", "*", ""))
+                print(
+                    f"{size:>10} {'fetchall':>9} {elapsed:>9.2f} {peak / 2**20:>9.2f}"
+                )
+
+        db.close_db_pool()
+
+
+if __name__ == "__main__":
+    main()
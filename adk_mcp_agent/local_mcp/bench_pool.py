@@ -0,0 +1,64 @@
+"""Benchmark: per-call `sqlite3.connect` versus the pooled connection path.
+
+Usage:
+    python bench_pool.py [--calls 5000] [--pool-size 4]
+
+Runs against a throwaway copy of the seeded schema so `database.db` is
+never touched. The query cache is disabled so every pooled call reaches
+SQLite.
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+
+def _per_call_query(database_path: str) -> list[dict]:
+    # Mirrors the pre-pool behaviour of `query_db_table`
+    conn = sqlite3.connect(database_path)
+    conn.row_factory = sqlite3.Row
+    rows = [dict(row) for row in conn.execute("SELECT * FROM todos WHERE user_id = 1;")]
+    conn.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_path = os.path.join(tmp_dir, "bench.db")
+        os.environ["SQLITE_DB_PATH"] = database_path
+        os.environ["SQLITE_POOL_SIZE"] = str(args.pool_size)
+        os.environ["SQLITE_QUERY_CACHE_MAX_BYTES"] = "0"
+        os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+
+        # Imported late so both modules pick up the benchmark database path
+        import db
+        from init_db import init_database
+
+        init_database()
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            _per_call_query(database_path)
+        per_call = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            db.query_db_table("todos", "*", "user_id = 1")
+        pooled = time.perf_counter() - start
+        db.close_db_pool()
+
+    print(f"calls:      {args.calls}")
+    print(f"per-call:   {per_call:.3f}s  ({per_call / args.calls * 1e6:.1f} us/call)")
+    print(f"pooled:     {pooled:.3f}s  ({pooled / args.calls * 1e6:.1f} us/call)")
+    print(f"speedup:    {per_call / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: word search over todo tasks, FTS5 index versus a LIKE scan.
+
+Usage:
+    python bench_search.py [--todos 1000000] [--users 10000] [--limit 20] [--repeat 5]
+
+Builds a throwaway database with `init_database`, which also creates the
+`todos_fts` index, then times `search_todos` against the equivalent
+`query_db_table` LIKE condition for a few queries. The query cache is
+disabled so every repetition reaches SQLite.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+QUERIES: tuple[str, ...] = ("groceries", "project report", "dentist 4242", "nothing")
+
+
+def _median_ms(fn, repeat: int):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def _like_condition(query: str) -> str:
+    return " AND ".join(f"task LIKE '%{word}%'" for word in query.split())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--todos", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp_dir, "bench.db")
+        os.environ["SQLITE_QUERY_CACHE_MAX_BYTES"] = "0"
+        os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+
+        # Imported late so both modules pick up the benchmark database path
+        import db
+        from init_db import init_database
+
+        init_database(users=args.users, todos=args.todos)
+
+        print(f"{'query':>16} {'mode':>12} {'ms':>9} {'rows':>6}")
+        for query in QUERIES:
+            fts_ms, page = _median_ms(
+                lambda: db.search_todos(query, args.limit, ""), args.repeat
+            )
+            print(f"{query:>16} {'fts':>12} {fts_ms:>9.2f} {len(page['rows']):>6}")
+
+            # LIKE '%word%' cannot use an index, so every row's task is scanned
+            condition = _like_condition(query)
+            like_ms, rows = _median_ms(
+                lambda: db.query_db_table("todos", "*", condition), args.repeat
+            )
+            print(f"{query:>16} {'like (all)':>12} {like_ms:>9.2f} {len(rows):>6}")
+
+            limited_ms, rows = _median_ms(
+                lambda: db.query_db_table(
+                    "todos", "*", f"{condition} LIMIT {args.limit}"
+                ),
+                args.repeat,
+            )
+            print(f"{query:>16} {'like (limit)':>12} {limited_ms:>9.2f} {len(rows):>6}")
+
+        db.close_db_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Load and latency benchmark for the SQLite MCP server.
+
+Usage:
+    python bench_server.py [--transport inprocess|stdio|http] [--clients 1] [--concurrency 8]
+                           [--requests 2000] [--mix list_tools=1,query_db_table=6,insert_data=2,delete_data=1]
+                           [--seed-todos 10000] [--output results.json]
+
+Starts `server.py` as a stdio subprocess, as a local streamable HTTP server
+or in-process through the low-level `Server` app, replays a weighted mix of
+requests from scripted MCP clients spread over `--clients` sessions, and
+prints throughput plus p50/p95/p99 latency per tool as JSON. Runs against a
+throwaway database and only ever talks to 127.0.0.1.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+from contextlib import AsyncExitStack, asynccontextmanager, redirect_stdout
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+DEFAULT_MIX: str = "list_tools=1,query_db_table=6,insert_data=2,delete_data=1"
+BENCH_TASK: str = "bench task"
+
+# Arguments replayed for every tool call in the mix
+TOOL_ARGUMENTS: dict[str, dict] = {
+    "query_db_table": {
+        "table_name": "todos",
+        "columns": "id, task, completed",
+        "condition": "user_id = 2 AND completed = 0",
+    },
+    "insert_data": {
+        "table_name": "todos",
+        "data": {"user_id": 1, "task": BENCH_TASK, "completed": 0},
+    },
+    "delete_data": {
+        "table_name": "todos",
+        "condition": f"id = (SELECT MAX(id) FROM todos WHERE task = '{BENCH_TASK}')",
+    },
+}
+
+
+def _parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for item in mix.split(","):
+        name, weight = (part.strip() for part in item.split("="))
+        if name != "list_tools" and name not in TOOL_ARGUMENTS:
+            raise SystemExit(f"Unknown operation in mix: {name}")
+        weights[name] = int(weight)
+    return weights
+
+
+def _percentile(sorted_latencies: list[float], percent: int) -> float:
+    if len(sorted_latencies) == 1:
+        return sorted_latencies[0]
+    return statistics.quantiles(sorted_latencies, n=100, method="inclusive")[
+        percent - 1
+    ]
+
+
+def _seed_database(database_path: str, todos: int) -> None:
+    os.environ["SQLITE_DB_PATH"] = database_path
+
+    # Imported late so the module picks up the benchmark database path
+    import db
+    from init_db import init_database
+
+    # Keep the seeding output off stdout, which carries the JSON report
+    with redirect_stdout(sys.stderr):
+        init_database()
+    db.insert_many(
+        "todos",
+        [
+            {"user_id": i % 3 + 1, "task": f"Seeded task {i}", "completed": i % 2}
+            for i in range(todos)
+        ],
+    )
+    db.close_db_pool()
+
+
+async def _wait_for_port(host: str, port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            await writer.wait_closed()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"MCP HTTP server did not listen on {host}:{port}.")
+            await asyncio.sleep(0.1)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def _open_sessions(transport: str, env: dict[str, str], clients: int):
+    """Yields `clients` initialized MCP client sessions to one server instance."""
+
+    async with AsyncExitStack() as stack:
+        sessions: list[ClientSession] = []
+        if transport == "stdio":
+            # A stdio server serves exactly one client
+            server_params = StdioServerParameters(
+                command=sys.executable,
+                args=[SERVER_PATH],
+                env=env,
+                cwd=os.path.dirname(SERVER_PATH),
+            )
+            streams = await stack.enter_async_context(stdio_client(server_params))
+            session = await stack.enter_async_context(ClientSession(*streams))
+            await session.initialize()
+            sessions.append(session)
+        elif transport == "http":
+            from mcp.client.streamable_http import streamablehttp_client
+
+            port = _free_port()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                SERVER_PATH,
+                "--transport",
+                "http",
+                "--port",
+                str(port),
+                env=env,
+                cwd=os.path.dirname(SERVER_PATH),
+            )
+            stack.push_async_callback(process.wait)
+            stack.callback(process.terminate)
+            await _wait_for_port("127.0.0.1", port)
+            for _ in range(clients):
+                read_stream, write_stream, _ = await stack.enter_async_context(
+                    streamablehttp_client(f"http://127.0.0.1:{port}/mcp/")
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                await session.initialize()
+                sessions.append(session)
+        else:
+            from mcp.shared.memory import create_connected_server_and_client_session
+
+            # Imported late so the server picks up the benchmark environment
+            os.environ.update(env)
+            import server
+
+            stack.callback(server.stop_logging)
+            stack.callback(server.close_db_pool)
+            stack.callback(server.TOOL_EXECUTOR.shutdown)
+            for _ in range(clients):
+                session = await stack.enter_async_context(
+                    create_connected_server_and_client_session(
+                        server.app, raise_exceptions=True
+                    )
+                )
+                sessions.append(session)
+        yield sessions
+
+
+async def _call(session: ClientSession, operation: str) -> bool:
+    if operation == "list_tools":
+        await session.list_tools()
+        return True
+    result = await session.call_tool(operation, TOOL_ARGUMENTS[operation])
+    if result.isError:
+        return False
+    try:
+        payload = json.loads(result.content[0].text)
+    except (IndexError, ValueError):
+        return False
+    return not (isinstance(payload, dict) and payload.get("success") is False)
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    mix = _parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    schedule = rng.choices(list(mix), weights=list(mix.values()), k=args.requests)
+
+    # Results are returned inline, as before result spilling, so the timings stay
+    # comparable; set before seeding, which imports db in this process
+    os.environ["MCP_SPILL_MAX_ROWS"] = os.environ["MCP_SPILL_MAX_BYTES"] = "0"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_path = os.path.join(tmp_dir, "bench.db")
+        _seed_database(database_path, args.seed_todos)
+        env = {
+            **os.environ,
+            "SQLITE_DB_PATH": database_path,
+            "MCP_LOG_FILE": os.path.join(tmp_dir, "mcp_server.log"),
+        }
+
+        latencies: dict[str, list[float]] = {operation: [] for operation in mix}
+        errors: dict[str, int] = {operation: 0 for operation in mix}
+        async with _open_sessions(args.transport, env, args.clients) as sessions:
+            pending = iter(schedule)
+
+            async def client(session: ClientSession) -> None:
+                for operation in pending:
+                    start = time.perf_counter()
+                    try:
+                        ok = await _call(session, operation)
+                    except Exception:
+                        ok = False
+                    latencies[operation].append(time.perf_counter() - start)
+                    if not ok:
+                        errors[operation] += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(client(sessions[i % len(sessions)]) for i in range(args.concurrency))
+            )
+            elapsed = time.perf_counter() - start
+
+    tools = {}
+    for operation, samples in latencies.items():
+        if not samples:
+            continue
+        samples.sort()
+        tools[operation] = {
+            "requests": len(samples),
+            "errors": errors[operation],
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(_percentile(samples, 50) * 1e3, 3),
+            "p95_ms": round(_percentile(samples, 95) * 1e3, 3),
+            "p99_ms": round(_percentile(samples, 99) * 1e3, 3),
+        }
+    return {
+        "transport": args.transport,
+        "clients": len(sessions),
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 2),
+        "errors": sum(errors.values()),
+        "tools": tools,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transport", choices=["inprocess", "stdio", "http"], default="inprocess"
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=1,
+        help="MCP client sessions sharing the load; stdio always uses one.",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed-todos", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the JSON report to this file.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+    report_text = json.dumps(report, indent=2)
+    print(report_text)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(report_text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,73 @@
 import os
+import re
+import json
+import time
+import queue
+import base64
+import hashlib
 import sqlite3
 import logging
+import threading
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from sqlite3 import Connection
+from typing import Iterator
+
+from log_config import LogPayload
+from result_spill import (
+    RESULT_SPILL_STORE,
+    SPILL_MAX_BYTES,
+    SPILL_MAX_ROWS,
+    SPILL_PREVIEW_ROWS,
+)
 
 
 # DB setup
-DATABASE_PATH = os.path.join(os.path.dirname(__file__), "database.db")
+DATABASE_PATH = os.getenv(
+    "SQLITE_DB_PATH", os.path.join(os.path.dirname(__file__), "database.db")
+)
+
+# Connection pool setup
+POOL_SIZE: int = int(os.getenv("SQLITE_POOL_SIZE", "4"))
+POOL_TIMEOUT_SECONDS: float = float(os.getenv("SQLITE_POOL_TIMEOUT", "30"))
+
+# Pagination setup
+MAX_PAGE_SIZE: int = int(os.getenv("SQLITE_MAX_PAGE_SIZE", "500"))
+FETCH_BATCH_SIZE: int = int(os.getenv("SQLITE_FETCH_BATCH_SIZE", "100"))
+
+# Bulk insert setup
+INSERT_CHUNK_SIZE: int = int(os.getenv("SQLITE_INSERT_CHUNK_SIZE", "500"))
+
+# Query result cache setup
+QUERY_CACHE_MAX_BYTES: int = int(
+    os.getenv("SQLITE_QUERY_CACHE_MAX_BYTES", str(16 * 1024 * 1024))
+)
+QUERY_CACHE_TTL_SECONDS: float = float(os.getenv("SQLITE_QUERY_CACHE_TTL", "60"))
+
+# Aggregation setup
+AGGREGATE_FUNCTIONS: tuple[str, ...] = ("count", "sum", "avg", "min", "max")
+MAX_AGGREGATE_GROUPS: int = int(os.getenv("SQLITE_MAX_AGGREGATE_GROUPS", "1000"))
+
+# Batch setup
+MAX_BATCH_OPERATIONS: int = int(os.getenv("SQLITE_MAX_BATCH_OPERATIONS", "100"))
+
+# Full-text search setup
+TODOS_FTS_TABLE: str = "todos_fts"
+
+# Query plan advisor setup: EXPLAIN every read/delete and track scans (opt-in)
+QUERY_ADVISOR_ENABLED: bool = os.getenv("SQLITE_QUERY_ADVISOR", "0") == "1"
+QUERY_ADVISOR_CREATE_INDEXES: bool = (
+    os.getenv("SQLITE_QUERY_ADVISOR_CREATE_INDEXES", "0") == "1"
+)
+
+# Pragmas applied to every pooled connection when it is opened
+CONNECTION_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-16000")),  # negative = KiB
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+}
 
 
 def get_db_connection() -> Connection:
@@ -15,6 +76,617 @@ def get_db_connection() -> Connection:
     return conn
 
 
+class ConnectionPool:
+    """A fixed-size pool of long-lived SQLite connections.
+
+    Connections are opened lazily up to `size`, configured once with
+    `pragmas`, health checked on checkout and rolled back on return so a
+    failed tool call never leaks an open transaction to the next caller.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        size: int = POOL_SIZE,
+        pragmas: dict[str, str | int] | None = None,
+        timeout: float = POOL_TIMEOUT_SECONDS,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}.")
+
+        self.database_path = database_path
+        self.size = size
+        self.pragmas = CONNECTION_PRAGMAS if pragmas is None else pragmas
+        self.timeout = timeout
+
+        self._idle: queue.LifoQueue[Connection] = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._in_use: dict[int, Connection] = {}
+        self._closed = False
+
+    @property
+    def opened(self) -> int:
+        """Number of connections currently open, idle or checked out."""
+
+        return self._opened
+
+    def _open_connection(self) -> Connection:
+        conn = sqlite3.connect(
+            self.database_path, timeout=self.timeout, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row  # To access columns by name
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value};")
+        logging.debug(f"Opened pooled connection to `{self.database_path}`.")
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: Connection) -> bool:
+        try:
+            conn.execute("SELECT 1;").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def _open_counted_connection(self) -> Connection:
+        # The caller has already counted this connection in `_opened`
+        try:
+            return self._open_connection()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def acquire(self) -> Connection:
+        """Checks a healthy connection out of the pool, opening one if allowed."""
+
+        conn = self._checkout()
+        with self._lock:
+            self._in_use[threading.get_ident()] = conn
+        return conn
+
+    def _checkout(self) -> Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed.")
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                return self._open_counted_connection()
+            try:
+                conn = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"Timed out after {self.timeout}s waiting for a database connection."
+                )
+
+        if not self._is_healthy(conn):
+            logging.warning("Discarding unhealthy pooled connection and reopening.")
+            self._discard(conn)
+            with self._lock:
+                self._opened += 1
+            conn = self._open_counted_connection()
+        return conn
+
+    def release(self, conn: Connection) -> None:
+        """Returns a connection to the pool, rolling back any open transaction."""
+
+        with self._lock:
+            if self._in_use.get(threading.get_ident()) is conn:
+                del self._in_use[threading.get_ident()]
+
+        if self._closed:
+            self._discard(conn)
+            return
+
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        self._idle.put_nowait(conn)
+
+    def interrupt(self, thread_id: int) -> bool:
+        """Aborts the statement running on the connection held by `thread_id`."""
+
+        with self._lock:
+            conn = self._in_use.get(thread_id)
+        if conn is None:
+            return False
+        conn.interrupt()
+        return True
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Closes every idle connection and refuses further checkouts."""
+
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+        logging.info(f"Connection pool for `{self.database_path}` closed.")
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_db_pool() -> ConnectionPool:
+    """Returns the process-wide connection pool, creating it on first use."""
+
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                logging.info(
+                    f"Creating connection pool of size `{POOL_SIZE}` for `{DATABASE_PATH}`."
+                )
+                _pool = ConnectionPool(DATABASE_PATH)
+    return _pool
+
+
+def close_db_pool() -> None:
+    """Closes the process-wide connection pool if it was ever created."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+_SHADOW_TABLE_SUFFIXES: tuple[str, ...] = (
+    "data",
+    "idx",
+    "docsize",
+    "config",
+    "content",
+)
+
+
+class SchemaCatalog:
+    """In-memory catalog of table names and column definitions.
+
+    The catalog is built once from `sqlite_master` and `PRAGMA table_info`
+    and reused until `PRAGMA schema_version` changes, which SQLite bumps on
+    every DDL statement from any connection or process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._schema_version: int | None = None
+        self._tables: list[str] = []
+        self._columns: dict[str, list[dict]] = {}
+
+    @staticmethod
+    def _read_schema_version(conn: Connection) -> int:
+        return conn.execute("PRAGMA schema_version;").fetchone()[0]
+
+    def _rebuild(self, conn: Connection, schema_version: int) -> None:
+        logging.info(f"Building schema catalog for schema version `{schema_version}`.")
+        tables: list[str] = []
+        columns: dict[str, list[dict]] = {}
+        rows = conn.execute(
+            "SELECT name, type, sql FROM sqlite_master WHERE type IN ('table', 'view');"
+        ).fetchall()
+        # Shadow tables backing virtual tables (e.g. FTS5 indexes) are not for querying
+        shadow_tables = {
+            f"{row['name']}_{suffix}"
+            for row in rows
+            if (row["sql"] or "").upper().startswith("CREATE VIRTUAL TABLE")
+            for suffix in _SHADOW_TABLE_SUFFIXES
+        }
+        for row in rows:
+            if row["name"] in shadow_tables:
+                continue
+            if row["type"] == "table":
+                tables.append(row["name"])
+            table_info = conn.execute(f"PRAGMA table_info('{row['name']}');")
+            columns[row["name"].lower()] = [
+                {"name": column["name"], "type": column["type"]}
+                for column in table_info.fetchall()
+            ]
+        self._tables = tables
+        self._columns = columns
+        self._schema_version = schema_version
+
+    def refresh(self, conn: Connection) -> None:
+        """Rebuilds the catalog if the database schema changed since the last build."""
+
+        schema_version = self._read_schema_version(conn)
+        if schema_version == self._schema_version:
+            return
+        with self._lock:
+            if schema_version != self._schema_version:
+                self._rebuild(conn, schema_version)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._schema_version = None
+
+    def tables(self) -> list[str]:
+        with get_db_pool().connection() as conn:
+            self.refresh(conn)
+        return list(self._tables)
+
+    def columns(
+        self, table_name: str, conn: Connection | None = None
+    ) -> list[dict] | None:
+        """Returns the column definitions of `table_name`, or None if unknown.
+
+        Pass `conn` when the caller already holds a pooled connection.
+        """
+
+        if conn is None:
+            with get_db_pool().connection() as conn:
+                self.refresh(conn)
+        else:
+            self.refresh(conn)
+        columns = self._columns.get(table_name.lower())
+        return None if columns is None else [dict(column) for column in columns]
+
+
+SCHEMA_CATALOG = SchemaCatalog()
+
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+# `column <op>` comparisons an index can seek on. LIKE, GLOB, `!=` and functions
+# of a column are left out: SQLite scans for those whatever indexes exist
+_SARGABLE_COMPARISON_PATTERN = re.compile(
+    r"\b([A-Za-z_][A-Za-z0-9_]*)\s*(?:==?|<(?!>)=?|>=?|IN\b|IS\b(?!\s+NOT\b)|BETWEEN\b)",
+    re.IGNORECASE,
+)
+_TABLE_REFERENCE_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN)\s+([A-Za-z_][A-Za-z0-9_]*)(?:\s+(?:AS\s+)?([A-Za-z_][A-Za-z0-9_]*))?",
+    re.IGNORECASE,
+)
+_SQL_CLAUSE_KEYWORDS: frozenset[str] = frozenset(
+    "WHERE ON USING JOIN INNER LEFT RIGHT FULL CROSS NATURAL "
+    "GROUP ORDER HAVING LIMIT UNION EXCEPT INTERSECT".split()
+)
+
+# Write counters per table, bumped by every tool that modifies rows
+_table_versions: dict[str, int] = {}
+_table_versions_lock = threading.Lock()
+
+
+def bump_table_version(table_name: str) -> None:
+    """Marks every cached result that reads `table_name` as stale."""
+
+    with _table_versions_lock:
+        key = table_name.lower()
+        _table_versions[key] = _table_versions.get(key, 0) + 1
+
+
+def _table_version_tag(query: str) -> tuple:
+    # Every identifier in the query is treated as a possible table reference, so
+    # tables read through joins or sub-queries in the condition are covered too
+    identifiers = {word.lower() for word in _IDENTIFIER_PATTERN.findall(query)}
+    with _table_versions_lock:
+        return tuple(
+            sorted((name, _table_versions.get(name, 0)) for name in identifiers)
+        )
+
+
+def _estimate_result_size(rows: list[dict]) -> int:
+    size = 64
+    for row in rows:
+        size += 64
+        for key, value in row.items():
+            size += len(key) + (len(value) if isinstance(value, (str, bytes)) else 8)
+    return size
+
+
+class QueryResultCache:
+    """LRU cache of `query_db_table` results with a TTL and a byte budget.
+
+    Each entry is tagged with the versions of the tables its query references,
+    so a lookup made after `insert_data` or `delete_data` touched one of them
+    misses instead of returning stale rows. Writes made outside this process are
+    only picked up once the entry's TTL expires.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = QUERY_CACHE_MAX_BYTES,
+        ttl_seconds: float = QUERY_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        tool_name: str, table_name: str, columns: str, condition: str
+    ) -> tuple:
+        # The tool name keeps each tool's keys apart, since they pack different
+        # arguments into the same three fields. Only outer whitespace is dropped:
+        # inner whitespace can sit inside string literals or end a `--` comment
+        return (
+            tool_name,
+            table_name.strip().lower(),
+            columns.strip(),
+            condition.strip(),
+        )
+
+    def _remove(self, key: tuple) -> None:
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: tuple, version_tag: tuple) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                rows, entry_tag, expires_at, _ = entry
+                if entry_tag == version_tag and time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return [dict(row) for row in rows]
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, version_tag: tuple, rows: list[dict]) -> None:
+        size = _estimate_result_size(rows)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expires_at = time.monotonic() + self.ttl_seconds
+            self._entries[key] = (
+                [dict(row) for row in rows],
+                version_tag,
+                expires_at,
+                size,
+            )
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+QUERY_CACHE = QueryResultCache()
+
+
+class QueryPlanAdvisor:
+    """Records full table scans and temp B-trees reported by `EXPLAIN QUERY PLAN`.
+
+    Findings are counted per table and per set of filter/order columns, which
+    is enough to suggest the index that would have avoided them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._findings: dict[tuple, dict] = {}
+
+    @staticmethod
+    def indexable_columns(
+        conn: Connection, table_name: str
+    ) -> dict[str, str] | None:
+        """Maps the lowercased names of the columns of `table_name` an index can use.
+
+        The INTEGER PRIMARY KEY is left out: it is the rowid, which every index
+        already holds. Returns None if `table_name` is not a table, e.g. a subquery.
+        """
+
+        # cid, name, type, notnull, dflt_value, pk
+        table_info = conn.execute(f"PRAGMA table_info('{table_name}');").fetchall()
+        if not table_info:
+            return None
+        primary_keys = [column for column in table_info if column[5]]
+        rowid_alias = None
+        if len(primary_keys) == 1 and primary_keys[0][2].upper() == "INTEGER":
+            rowid_alias = primary_keys[0][1]
+        return {
+            column[1].lower(): column[1]
+            for column in table_info
+            if column[1] != rowid_alias
+        }
+
+    @staticmethod
+    def filter_columns(names: dict[str, str], condition: str) -> list[str]:
+        """Returns the columns in `names` an index could seek on for `condition`."""
+
+        condition = _STRING_LITERAL_PATTERN.sub("''", condition or "")
+        filtered: list[str] = []
+        for match in _SARGABLE_COMPARISON_PATTERN.finditer(condition):
+            name = names.get(match.group(1).lower())
+            if name and name not in filtered:
+                filtered.append(name)
+        return filtered
+
+    @staticmethod
+    def order_columns(names: dict[str, str], order_by: str) -> list[str]:
+        """Returns the columns in `names` that `order_by` sorts on, in order."""
+
+        ordered: list[str] = []
+        for term in (order_by or "").split(","):
+            words = term.split()
+            # `todos.completed DESC` sorts on completed; `lower(task)` on an expression
+            column = words[0].rsplit(".", 1)[-1] if words else ""
+            if not _IDENTIFIER_PATTERN.fullmatch(column):
+                continue
+            name = names.get(column.lower())
+            if name and name not in ordered:
+                ordered.append(name)
+        return ordered
+
+    @staticmethod
+    def selected_columns(names: dict[str, str], columns: str) -> list[str]:
+        """Returns the columns in `names` that `columns` selects, in order."""
+
+        selected: list[str] = []
+        for word in _IDENTIFIER_PATTERN.findall(columns or ""):
+            name = names.get(word.lower())
+            if name and name not in selected:
+                selected.append(name)
+        return selected
+
+    def explain(
+        self,
+        conn: Connection,
+        table_name: str,
+        query: str,
+        params: list | tuple = (),
+        condition: str = "",
+        order_by: str = "",
+        columns: str = "",
+    ) -> None:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        # The plan names tables by their alias, e.g. `SCAN t` for `FROM todos t`
+        aliases = {}
+        for table, alias in _TABLE_REFERENCE_PATTERN.findall(query):
+            aliases[table.lower()] = table
+            if alias and alias.upper() not in _SQL_CLAUSE_KEYWORDS:
+                aliases[alias.lower()] = table
+        for row in plan:
+            detail: str = row[3]
+            words = detail.split()
+            # Any SCAN reads every row, also `SCAN t USING COVERING INDEX`;
+            # only a SEARCH seeks the rows it needs
+            if detail.startswith("SCAN ") and "VIRTUAL" not in words:
+                kind = "full_scans"
+                scanned_table = aliases.get(words[1].lower(), words[1])
+            elif detail.startswith("USE TEMP B-TREE"):
+                kind, scanned_table = "temp_btrees", table_name
+            else:
+                continue
+            names = self.indexable_columns(conn, scanned_table)
+            if names is None:
+                continue
+            # Columns are matched against the scanned table only, so a scan inside
+            # a subquery is not given the columns of the outer table
+            filter_columns = self.filter_columns(names, condition)
+            order_columns = self.order_columns(names, order_by)
+            key = (scanned_table.lower(), tuple(filter_columns), tuple(order_columns))
+            with self._lock:
+                finding = self._findings.setdefault(
+                    key,
+                    {
+                        "table_name": scanned_table,
+                        "filter_columns": filter_columns,
+                        "order_columns": order_columns,
+                        "selected_columns": [],
+                        "full_scans": 0,
+                        "temp_btrees": 0,
+                    },
+                )
+                finding[kind] += 1
+                finding["last_query"] = query
+                for column in self.selected_columns(names, columns):
+                    if column not in finding["selected_columns"]:
+                        finding["selected_columns"].append(column)
+            logging.warning("Query plan for `%s` reports `%s`.", query, detail)
+
+    @staticmethod
+    def suggest_index(finding: dict) -> str | None:
+        # Without a filter an index can only save the sort, not the scan
+        if not finding["filter_columns"] and not finding["temp_btrees"]:
+            return None
+        key_columns = finding["filter_columns"] + [
+            column
+            for column in finding["order_columns"]
+            if column not in finding["filter_columns"]
+        ]
+        if not key_columns:
+            return None
+        # Selected columns are appended so the index can answer the query on its own
+        covering_columns = key_columns + [
+            column
+            for column in finding["selected_columns"]
+            if column not in key_columns
+        ]
+        table_name = finding["table_name"]
+        # Named after every indexed column, so IF NOT EXISTS only skips an index
+        # with this exact definition, never one that covers different columns
+        index_name = "idx_" + "_".join([table_name] + covering_columns).lower()
+        return f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(covering_columns)})"
+
+    def report(self) -> list[dict]:
+        with self._lock:
+            findings = [dict(finding) for finding in self._findings.values()]
+        for finding in findings:
+            finding["suggested_index"] = self.suggest_index(finding)
+        return sorted(
+            findings,
+            key=lambda finding: finding["full_scans"] + finding["temp_btrees"],
+            reverse=True,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._findings.clear()
+
+
+QUERY_PLAN_ADVISOR = QueryPlanAdvisor()
+
+
+def _advise_query_plan(
+    conn: Connection,
+    table_name: str,
+    query: str,
+    params: list | tuple = (),
+    condition: str = "",
+    order_by: str = "",
+    columns: str = "",
+) -> None:
+    if not QUERY_ADVISOR_ENABLED:
+        return
+    QUERY_PLAN_ADVISOR.explain(
+        conn, table_name, query, params, condition, order_by, columns
+    )
+
+
 def list_db_tables(dummy_param: str) -> dict:
     """Lists all tables in the SQLite database.
 
@@ -27,14 +699,10 @@ def list_db_tables(dummy_param: str) -> dict:
     """
 
     try:
-        logging.info(f"List db tables called with `{dummy_param}` params.")
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        logging.info("Fetching all tables from db...")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        logging.info(f"Found `{len(tables)}` tables.")
+        logging.info("List db tables called with `%s` params.", dummy_param)
+        logging.info("Fetching all tables from schema catalog...")
+        tables = SCHEMA_CATALOG.tables()
+        logging.info("Found `%s` tables.", len(tables))
         return {
             "success": True,
             "message": "Tables listed successfully.",
@@ -55,24 +723,87 @@ def list_db_tables(dummy_param: str) -> dict:
 def get_table_schema(table_name: str) -> dict:
     """Gets the schema (column names and types) of a specific table."""
 
-    logging.info(f"Get table schema called with `{table_name}` params.")
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    logging.info(f"Fetching `{table_name}` table schema...")
-    cursor.execute(f"PRAGMA table_info('{table_name}');")  # Use PRAGMA for schema
-    schema_info = cursor.fetchall()
-    conn.close()
-    if not schema_info:
+    logging.info("Get table schema called with `%s` params.", table_name)
+    logging.info("Fetching `%s` table schema from schema catalog...", table_name)
+    columns = SCHEMA_CATALOG.columns(table_name)
+    if not columns:
         logging.error(f"Table `{table_name}` not found or no schema information.")
         raise ValueError(f"Table '{table_name}' not found or no schema information.")
 
-    logging.info(f"Table `{table_name}` schema found successfully.")
-    columns = [{"name": row["name"], "type": row["type"]} for row in schema_info]
-    logging.info(f"Table `{table_name}` has `{len(columns)}` many columns.")
+    logging.info("Table `%s` schema found successfully.", table_name)
+    logging.info("Table `%s` has `%s` many columns.", table_name, len(columns))
     return {"table_name": table_name, "columns": columns}
 
 
-def query_db_table(table_name: str, columns: str, condition: str) -> list[dict]:
+def _select_query(table_name: str, columns: str, condition: str) -> str:
+    query = f"SELECT {columns} FROM {table_name}"
+    if condition:
+        query += f" WHERE {condition}"
+    return query + ";"
+
+
+def _insert_query(table_name: str, data: dict) -> tuple[str, tuple]:
+    columns = ", ".join(data.keys())
+    placeholders = ", ".join(["?" for _ in data])
+    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    return query, tuple(data.values())
+
+
+def _delete_query(table_name: str, condition: str) -> str:
+    return f"DELETE FROM {table_name} WHERE {condition}"
+
+
+def _fetch_batches(cursor: sqlite3.Cursor) -> Iterator[list[dict]]:
+    while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+        yield [dict(row) for row in batch]
+
+
+def _fetch_within_spill_limits(
+    cursor: sqlite3.Cursor,
+) -> tuple[list[dict], Iterator[list[dict]] | None]:
+    # Buffers rows until the result is complete or exceeds a spill limit; in the
+    # latter case the batches not read yet are returned alongside
+    batches = _fetch_batches(cursor)
+    rows: list[dict] = []
+    size = 0
+    for batch in batches:
+        rows.extend(batch)
+        size += _estimate_result_size(batch)
+        if (SPILL_MAX_ROWS and len(rows) > SPILL_MAX_ROWS) or (
+            SPILL_MAX_BYTES and size > SPILL_MAX_BYTES
+        ):
+            return rows, batches
+    return rows, None
+
+
+def _spill_result(
+    query: str, rows: list[dict], remaining: Iterator[list[dict]], key: str = ""
+) -> dict:
+    def _all_rows() -> Iterator[dict]:
+        yield from rows
+        for batch in remaining:
+            yield from batch
+
+    entry = RESULT_SPILL_STORE.spill(_all_rows(), description=query, key=key)
+    return _spilled_response(entry, rows[:SPILL_PREVIEW_ROWS])
+
+
+def _spilled_response(entry: dict, preview: list[dict]) -> dict:
+    return {
+        "success": True,
+        "message": (
+            f"Result has {entry['rows']} rows, too many to return inline. The first "
+            f"{len(preview)} rows are in 'rows'; read the full result from the "
+            f"resource '{entry['uri']}', or narrow the query or use query_db_table_page."
+        ),
+        "spilled": True,
+        "row_count": entry["rows"],
+        "resource_uri": entry["uri"],
+        "rows": preview,
+    }
+
+
+def query_db_table(table_name: str, columns: str, condition: str) -> list[dict] | dict:
     """Queries a table with an optional condition.
 
     Args:
@@ -80,36 +811,408 @@ def query_db_table(table_name: str, columns: str, condition: str) -> list[dict]:
         columns: Comma-separated list of columns to retrieve (e.g., "id, name"). Defaults to "*".
         condition: Optional SQL WHERE clause condition (e.g., "id = 1" or "completed = 0").
     Returns:
-        A list of dictionaries, where each dictionary represents a row.
+        A list of dictionaries, where each dictionary represents a row. Results too
+        large to return inline are saved instead: a dictionary with keys 'spilled'
+        (True), 'row_count' (int), 'resource_uri' (str) of the full result and
+        'rows' (list[dict]) with the first few rows is returned.
     """
 
     logging.info(
-        f"Query db table called with `{table_name, columns, condition}` params."
+        "Query db table called with `%s` params.",
+        LogPayload((table_name, columns, condition)),
     )
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    query = f"SELECT {columns} FROM {table_name}"
-    if condition:
-        query += f" WHERE {condition}"
-    query += ";"
+    query = _select_query(table_name, columns, condition)
 
-    try:
-        logging.info(f"Executing query `{query}` on table `{table_name}`")
-        cursor.execute(query)
-        results = [dict(row) for row in cursor.fetchall()]
+    cache_key = QueryResultCache.make_key(
+        "query_db_table", table_name, columns, condition
+    )
+    version_tag = _table_version_tag(query)
+    cached_results = QUERY_CACHE.get(cache_key, version_tag)
+    if cached_results is not None:
         logging.info(
-            f"Query `{query}` executed successfully on table `{table_name}`. Result Count `{len(results)}`."
+            "Query `%s` served from cache. Result Count `%s`.",
+            query,
+            len(cached_results),
         )
-    except sqlite3.Error as e:
-        conn.close()
-        logging.error(
-            f"Error querying table `{table_name}` for query `{query}`. Error: {e}"
-        )
-        raise ValueError(f"Error querying table '{table_name}': {e}")
-    conn.close()
+        return cached_results
+
+    # Spilled results are not cached: a repeat of the query, with no writes to
+    # its tables in between, is answered from the resource it was spilled to
+    spill_key = f"{query}\x1f{version_tag}"
+    spilled = RESULT_SPILL_STORE.get(spill_key)
+    if spilled is not None:
+        try:
+            preview = RESULT_SPILL_STORE.read(spilled["id"], 0, SPILL_PREVIEW_ROWS)
+        except KeyError:
+            # Evicted since the lookup; the query below spills it again
+            preview = None
+        if preview is not None:
+            logging.info("Query `%s` served from spilled result.", query)
+            return _spilled_response(
+                spilled, [json.loads(line) for line in preview.splitlines()]
+            )
+
+    with get_db_pool().connection() as conn:
+        cursor = conn.cursor()
+        try:
+            _advise_query_plan(
+                conn, table_name, query, condition=condition, columns=columns
+            )
+            logging.info("Executing query `%s` on table `%s`", query, table_name)
+            cursor.execute(query)
+            results, remaining = _fetch_within_spill_limits(cursor)
+            if remaining is not None:
+                return _spill_result(query, results, remaining, spill_key)
+            logging.info(
+                "Query `%s` executed successfully on table `%s`. Result Count `%s`.",
+                query,
+                table_name,
+                len(results),
+            )
+        except sqlite3.Error as e:
+            logging.error(
+                f"Error querying table `{table_name}` for query `{query}`. Error: {e}"
+            )
+            raise ValueError(f"Error querying table '{table_name}': {e}")
+    QUERY_CACHE.put(cache_key, version_tag, results)
     return results
 
 
+def _page_query_fingerprint(
+    table_name: str, columns: str, condition: str, order_by: str
+) -> str:
+    query_shape = "\x1f".join((table_name, columns, condition, order_by))
+    return hashlib.sha1(query_shape.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_key_value(value):
+    # BLOB sort keys are not JSON, so they travel as tagged base64
+    if isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Cannot encode a `{type(value).__name__}` sort key.")
+
+
+def _decode_key_value(value):
+    if isinstance(value, dict):
+        return base64.b64decode(value["b"], validate=True)
+    return value
+
+
+def _encode_page_token(fingerprint: str, *key) -> str:
+    payload = json.dumps({"q": fingerprint, "k": list(key)}, default=_encode_key_value)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_page_token(page_token: str, fingerprint: str, key_length: int = 2) -> tuple:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+        key = tuple(_decode_key_value(value) for value in payload["k"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid page token: {e}")
+    if payload.get("q") != fingerprint or len(key) != key_length:
+        raise ValueError("Page token does not belong to this query.")
+    return key
+
+
+def query_db_table_page(
+    table_name: str,
+    columns: str,
+    condition: str,
+    order_by: str,
+    limit: int,
+    page_token: str,
+) -> dict:
+    """Queries one page of a table, ordered by a stable key, for large results.
+
+    Args:
+        table_name: The name of the table to query.
+        columns: Comma-separated list of columns to retrieve (e.g., "id, name") or "*".
+        condition: Optional SQL WHERE clause condition (e.g., "completed = 0"). Use "" for none.
+        order_by: Column to order pages by (e.g., "id"). Use "" to order by row id.
+        limit: Maximum number of rows to return in this page.
+        page_token: The 'next_page_token' from the previous page, or "" for the first page.
+    Returns:
+        dict: A dictionary with keys 'rows' (list[dict]), 'count' (int) and
+              'next_page_token' (str), which is empty when there are no more rows.
+    """
+
+    logging.info(
+        "Query db table page called with `%s` params.",
+        LogPayload((table_name, columns, condition, order_by, limit)),
+    )
+    table_columns = SCHEMA_CATALOG.columns(table_name)
+    if not table_columns:
+        raise ValueError(f"Table '{table_name}' not found or no schema information.")
+    if order_by and order_by.lower() not in {c["name"].lower() for c in table_columns}:
+        raise ValueError(f"Cannot order by unknown column '{order_by}'.")
+    if limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit}.")
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    fingerprint = _page_query_fingerprint(table_name, columns, condition, order_by)
+    order_key = order_by or "rowid"
+    params: list = []
+    filters = [f"({condition})"] if condition else []
+    if page_token:
+        order_value, row_key = _decode_page_token(page_token, fingerprint)
+        if order_value is None:
+            # NULLs sort first, so resume inside the NULL run or move past it
+            filters.append(
+                f"(({order_key} IS NULL AND rowid > ?) OR {order_key} IS NOT NULL)"
+            )
+            params.append(row_key)
+        else:
+            filters.append(f"({order_key}, rowid) > (?, ?)")
+            params.extend([order_value, row_key])
+
+    query = f"SELECT {columns}, {order_key} AS __order_key, rowid AS __row_key FROM {table_name}"
+    if filters:
+        query += " WHERE " + " AND ".join(filters)
+    query += f" ORDER BY {order_key}, rowid LIMIT ?;"
+    params.append(limit + 1)
+
+    rows: list[dict] = []
+    has_more = False
+    last_key: tuple | None = None
+    with get_db_pool().connection() as conn:
+        try:
+            _advise_query_plan(
+                conn, table_name, query, params, condition, order_by, columns
+            )
+            logging.info("Executing query `%s` on table `%s`", query, table_name)
+            cursor = conn.execute(query, params)
+            while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+                for row in batch:
+                    if len(rows) == limit:
+                        has_more = True
+                        break
+                    record = dict(row)
+                    last_key = (record.pop("__order_key"), record.pop("__row_key"))
+                    rows.append(record)
+                if has_more:
+                    break
+            cursor.close()
+        except sqlite3.Error as e:
+            logging.error(
+                f"Error querying table `{table_name}` for query `{query}`. Error: {e}"
+            )
+            raise ValueError(f"Error querying table '{table_name}': {e}")
+
+    next_page_token = ""
+    if has_more and last_key is not None:
+        next_page_token = _encode_page_token(fingerprint, *last_key)
+    logging.info(
+        "Query `%s` executed successfully on table `%s`. Page Count `%s`, More `%s`.",
+        query,
+        table_name,
+        len(rows),
+        has_more,
+    )
+    return {"rows": rows, "count": len(rows), "next_page_token": next_page_token}
+
+
+def aggregate_table(
+    table_name: str, function: str, column: str, group_by: str, condition: str
+) -> dict:
+    """Computes an aggregate over a table in the database, optionally per group.
+
+    Use this instead of fetching rows to count or summarize them, e.g. open todos
+    per user: aggregate_table("todos", "count", "*", "user_id", "completed = 0").
+
+    Args:
+        table_name (str): The name of the table to aggregate.
+        function (str): One of "count", "sum", "avg", "min" or "max".
+        column (str): The column to aggregate, or "*" to count rows.
+        group_by (str): Comma-separated columns to group by (e.g., "user_id"). Use "" for none.
+        condition (str): Optional SQL WHERE clause condition (e.g., "completed = 0"). Use "" for none.
+
+    Returns:
+        dict: A dictionary with keys 'success' (bool), 'message' (str) and 'rows'
+              (list[dict]), each row holding the group_by columns and 'value'.
+    """
+
+    logging.info(
+        "Aggregate table called with `%s` params.",
+        LogPayload((table_name, function, column, group_by, condition)),
+    )
+    table_columns = SCHEMA_CATALOG.columns(table_name)
+    if not table_columns:
+        return {
+            "success": False,
+            "message": f"Table '{table_name}' not found or no schema information.",
+            "rows": [],
+        }
+
+    known_columns = {c["name"].lower(): c["name"] for c in table_columns}
+    function = function.strip().lower()
+    column = column.strip()
+    group_columns = [name.strip() for name in group_by.split(",") if name.strip()]
+    if function not in AGGREGATE_FUNCTIONS:
+        message = f"Unsupported aggregate function '{function}'. Use one of {', '.join(AGGREGATE_FUNCTIONS)}."
+    elif column == "*" and function != "count":
+        message = f"Aggregate function '{function}' needs a column, not '*'."
+    elif column != "*" and column.lower() not in known_columns:
+        message = f"Unknown column '{column}' in table '{table_name}'."
+    elif unknown := [
+        name for name in group_columns if name.lower() not in known_columns
+    ]:
+        message = f"Unknown group by column(s) {unknown} in table '{table_name}'."
+    else:
+        message = ""
+    if message:
+        logging.warning(message)
+        return {"success": False, "message": message, "rows": []}
+
+    group_list = ", ".join(known_columns[name.lower()] for name in group_columns)
+    target = column if column == "*" else known_columns[column.lower()]
+    select_list = f"{group_list + ', ' if group_list else ''}{function.upper()}({target}) AS value"
+    query = f"SELECT {select_list} FROM {table_name}"
+    if condition:
+        query += f" WHERE {condition}"
+    if group_list:
+        query += f" GROUP BY {group_list} ORDER BY {group_list}"
+    query += f" LIMIT {MAX_AGGREGATE_GROUPS + 1};"
+
+    cache_key = QueryResultCache.make_key(
+        "aggregate_table",
+        table_name,
+        select_list,
+        f"{condition} GROUP BY {group_list}",
+    )
+    version_tag = _table_version_tag(query)
+    results = QUERY_CACHE.get(cache_key, version_tag)
+    if results is None:
+        with get_db_pool().connection() as conn:
+            try:
+                _advise_query_plan(
+                    conn,
+                    table_name,
+                    query,
+                    condition=condition,
+                    order_by=group_list,
+                    columns=select_list,
+                )
+                logging.info("Executing query `%s` on table `%s`", query, table_name)
+                results = [dict(row) for row in conn.execute(query).fetchall()]
+            except sqlite3.Error as e:
+                logging.error(
+                    f"Error aggregating table `{table_name}` for query `{query}`. Error: {e}"
+                )
+                return {
+                    "success": False,
+                    "message": f"Error aggregating table '{table_name}': {e}",
+                    "rows": [],
+                }
+        QUERY_CACHE.put(cache_key, version_tag, results)
+
+    truncated = len(results) > MAX_AGGREGATE_GROUPS
+    rows = results[:MAX_AGGREGATE_GROUPS]
+    logging.info(
+        "Query `%s` executed successfully on table `%s`. Group Count `%s`.",
+        query,
+        table_name,
+        len(rows),
+    )
+    return {
+        "success": True,
+        "message": (
+            f"Aggregated {len(rows)} group(s), truncated to the first {MAX_AGGREGATE_GROUPS}."
+            if truncated
+            else f"Aggregated {len(rows)} group(s)."
+        ),
+        "rows": rows,
+    }
+
+
+def _fts_match_expression(text: str) -> str:
+    # Each word is quoted so user input can never be parsed as FTS5 query syntax
+    words = re.findall(r"\w+", text)
+    return " ".join('"' + word + '"' for word in words)
+
+
+def search_todos(query: str, limit: int, page_token: str) -> dict:
+    """Searches todo tasks by words, best matches first, one page at a time.
+
+    Args:
+        query (str): The words to search for (e.g., "project report"). All words must match.
+        limit (int): Maximum number of todos to return in this page.
+        page_token (str): The 'next_page_token' from the previous page, or "" for the first page.
+
+    Returns:
+        dict: A dictionary with keys 'success' (bool), 'message' (str), 'rows'
+              (list[dict]) with the matching todos, and 'next_page_token' (str),
+              which is empty when there are no more matches.
+    """
+
+    logging.info(
+        "Search todos called with `%s` params.", LogPayload((query, limit, page_token))
+    )
+    match_expression = _fts_match_expression(query)
+    if not match_expression:
+        return {
+            "success": False,
+            "message": "Search query must contain at least one word.",
+            "rows": [],
+            "next_page_token": "",
+        }
+    if not SCHEMA_CATALOG.columns(TODOS_FTS_TABLE):
+        return {
+            "success": False,
+            "message": "Full-text index is missing. Run init_db.py to create it.",
+            "rows": [],
+            "next_page_token": "",
+        }
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    fingerprint = _page_query_fingerprint(TODOS_FTS_TABLE, "", match_expression, "rank")
+    try:
+        offset = _decode_page_token(page_token, fingerprint, 1)[0] if page_token else 0
+    except ValueError as e:
+        return {"success": False, "message": str(e), "rows": [], "next_page_token": ""}
+
+    sql = (
+        f"SELECT todos.id, todos.user_id, todos.task, todos.completed "
+        f"FROM {TODOS_FTS_TABLE} JOIN todos ON todos.id = {TODOS_FTS_TABLE}.rowid "
+        f"WHERE {TODOS_FTS_TABLE} MATCH ? ORDER BY rank LIMIT ? OFFSET ?;"
+    )
+    cache_key = QueryResultCache.make_key(
+        "search_todos", TODOS_FTS_TABLE, match_expression, f"{limit} {offset}"
+    )
+    version_tag = _table_version_tag(sql)
+    rows = QUERY_CACHE.get(cache_key, version_tag)
+    if rows is None:
+        with get_db_pool().connection() as conn:
+            try:
+                logging.info("Executing query `%s` for `%s`", sql, match_expression)
+                cursor = conn.execute(sql, (match_expression, limit + 1, offset))
+                rows = [dict(row) for row in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logging.error(f"Error searching todos for `{query}`. Error: {e}")
+                return {
+                    "success": False,
+                    "message": f"Error searching todos: {e}",
+                    "rows": [],
+                    "next_page_token": "",
+                }
+        QUERY_CACHE.put(cache_key, version_tag, rows)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    logging.info(
+        "Search `%s` found `%s` todos, More `%s`.",
+        match_expression,
+        len(rows),
+        has_more,
+    )
+    return {
+        "success": True,
+        "message": f"Found {len(rows)} matching todo(s).",
+        "rows": rows,
+        "next_page_token": (
+            _encode_page_token(fingerprint, offset + limit) if has_more else ""
+        ),
+    }
+
+
 def insert_data(table_name: str, data: dict) -> dict:
     """Inserts a new row of data into the specified table.
 
@@ -123,27 +1226,28 @@ def insert_data(table_name: str, data: dict) -> dict:
               If successful, 'message' includes the ID of the newly inserted row.
     """
 
-    logging.info(f"Insert data called with `{table_name, data}` params.")
+    logging.info("Insert data called with `%s` params.", LogPayload((table_name, data)))
     if not data:
         logging.warning("No data provided for insertion")
         return {"success": False, "message": "No data provided for insertion."}
 
-    conn = get_db_connection()
+    pool = get_db_pool()
+    conn = pool.acquire()
     cursor = conn.cursor()
 
-    columns = ", ".join(data.keys())
-    placeholders = ", ".join(["?" for _ in data])
-    values = tuple(data.values())
-
-    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    query, values = _insert_query(table_name, data)
 
     try:
-        logging.info(f"Executing query `{query}` on table `{table_name}`")
+        logging.info("Executing query `%s` on table `%s`", query, table_name)
         cursor.execute(query, values)
         conn.commit()
+        bump_table_version(table_name)
         last_row_id = cursor.lastrowid
         logging.info(
-            f"Query `{query}` executed successfully on table `{table_name}`. Last row modified with id `{last_row_id}`."
+            "Query `%s` executed successfully on table `%s`. Last row modified with id `%s`.",
+            query,
+            table_name,
+            last_row_id,
         )
         return {
             "success": True,
@@ -160,7 +1264,108 @@ def insert_data(table_name: str, data: dict) -> dict:
             "message": f"Error inserting data into table '{table_name}': {e}",
         }
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+def insert_many(table_name: str, rows: list[dict]) -> dict:
+    """Inserts many rows into the specified table in a single transaction.
+
+    Args:
+        table_name (str): The name of the table to insert data into.
+        rows (list[dict]): The rows to insert. Every row must have exactly the
+                           same column names as keys.
+
+    Returns:
+        dict: A dictionary with keys 'success' (bool), 'message' (str),
+              'rows_inserted' (int) and 'chunks' (list[dict]) reporting, per chunk,
+              the rows inserted and last row ID, or the error for that chunk.
+    """
+
+    logging.info("Insert many called for `%s` with `%s` rows.", table_name, len(rows))
+    if not rows:
+        logging.warning("No rows provided for insertion")
+        return {"success": False, "message": "No rows provided for insertion."}
+
+    column_names = list(rows[0].keys())
+    expected_columns = set(column_names)
+    for position, row in enumerate(rows):
+        if not row or set(row.keys()) != expected_columns:
+            logging.warning(f"Row `{position}` does not match the column set of row 0.")
+            return {
+                "success": False,
+                "message": f"Row {position} has columns {sorted(row.keys())}, expected {sorted(expected_columns)}.",
+            }
+
+    columns = ", ".join(column_names)
+    placeholders = ", ".join(["?" for _ in column_names])
+    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+
+    pool = get_db_pool()
+    conn = pool.acquire()
+    chunks: list[dict] = []
+    rows_inserted = 0
+    try:
+        logging.info("Executing query `%s` on table `%s` in chunks", query, table_name)
+        conn.execute("BEGIN;")
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            chunk = rows[start : start + INSERT_CHUNK_SIZE]
+            values = [tuple(row[name] for name in column_names) for row in chunk]
+            # A savepoint per chunk lets one bad chunk fail without losing the rest
+            conn.execute("SAVEPOINT insert_chunk;")
+            try:
+                cursor = conn.executemany(query, values)
+                last_row_id = conn.execute("SELECT last_insert_rowid();").fetchone()[0]
+                conn.execute("RELEASE SAVEPOINT insert_chunk;")
+                rows_inserted += cursor.rowcount
+                chunks.append(
+                    {
+                        "start": start,
+                        "success": True,
+                        "rows_inserted": cursor.rowcount,
+                        "last_row_id": last_row_id,
+                    }
+                )
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO SAVEPOINT insert_chunk;")
+                conn.execute("RELEASE SAVEPOINT insert_chunk;")
+                logging.error(
+                    f"Error inserting chunk at `{start}` into table `{table_name}`. Error: {e}"
+                )
+                chunks.append(
+                    {
+                        "start": start,
+                        "success": False,
+                        "rows_inserted": 0,
+                        "message": str(e),
+                    }
+                )
+        conn.commit()
+        bump_table_version(table_name)
+    except sqlite3.Error as e:
+        conn.rollback()
+        logging.error(
+            f"Error inserting data into table `{table_name}` for query `{query}`. Error: {e}"
+        )
+        return {
+            "success": False,
+            "message": f"Error inserting data into table '{table_name}': {e}",
+        }
+    finally:
+        pool.release(conn)
+
+    failed_chunks = sum(1 for chunk in chunks if not chunk["success"])
+    logging.info(
+        "Inserted `%s` rows into table `%s`, `%s` chunk(s) failed.",
+        rows_inserted,
+        table_name,
+        failed_chunks,
+    )
+    return {
+        "success": failed_chunks == 0,
+        "message": f"{rows_inserted} of {len(rows)} row(s) inserted into table '{table_name}'.",
+        "rows_inserted": rows_inserted,
+        "chunks": chunks,
+    }
 
 
 def delete_data(table_name: str, condition: str) -> dict:
@@ -176,7 +1381,9 @@ def delete_data(table_name: str, condition: str) -> dict:
               If successful, 'message' includes the count of deleted rows.
     """
 
-    logging.info(f"Delete data called with `{table_name, condition}` params.")
+    logging.info(
+        "Delete data called with `%s` params.", LogPayload((table_name, condition))
+    )
     if not condition or not condition.strip():
         logging.warning("Deletion condition cannot be empty.")
         return {
@@ -184,18 +1391,24 @@ def delete_data(table_name: str, condition: str) -> dict:
             "message": "Deletion condition cannot be empty. This is a safety measure to prevent accidental deletion of all rows.",
         }
 
-    conn = get_db_connection()
+    pool = get_db_pool()
+    conn = pool.acquire()
     cursor = conn.cursor()
 
-    query = f"DELETE FROM {table_name} WHERE {condition}"
+    query = _delete_query(table_name, condition)
 
     try:
-        logging.info(f"Executing query `{query}` on table `{table_name}`")
+        _advise_query_plan(conn, table_name, query, condition=condition)
+        logging.info("Executing query `%s` on table `%s`", query, table_name)
         cursor.execute(query)
         rows_deleted = cursor.rowcount
         conn.commit()
+        bump_table_version(table_name)
         logging.info(
-            f"Query `{query}` executed successfully on table `{table_name}`. `{rows_deleted}` rows deleted."
+            "Query `%s` executed successfully on table `%s`. `%s` rows deleted.",
+            query,
+            table_name,
+            rows_deleted,
         )
         return {
             "success": True,
@@ -212,4 +1425,213 @@ def delete_data(table_name: str, condition: str) -> dict:
             "message": f"Error deleting data from table '{table_name}': {e}",
         }
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+def get_index_advice(create_indexes: bool) -> dict:
+    """Reports queries that needed full table scans or temporary B-trees, with suggested indexes.
+
+    Args:
+        create_indexes (bool): If true, also creates the suggested indexes. This only
+                               takes effect when index creation is enabled on the server.
+
+    Returns:
+        dict: A dictionary with keys 'success' (bool), 'message' (str), 'findings'
+              (list[dict]) with scan counts and a 'suggested_index' per finding, and
+              'created_indexes' (list[str]).
+    """
+
+    logging.info("Get index advice called with `%s` params.", create_indexes)
+    if not QUERY_ADVISOR_ENABLED:
+        return {
+            "success": False,
+            "message": "Query plan advisor is disabled. Set SQLITE_QUERY_ADVISOR=1 to enable it.",
+            "findings": [],
+            "created_indexes": [],
+        }
+
+    findings = QUERY_PLAN_ADVISOR.report()
+    created_indexes: list[str] = []
+    if create_indexes and not QUERY_ADVISOR_CREATE_INDEXES:
+        logging.warning("Index creation requested but not enabled on the server.")
+    elif create_indexes:
+        statements = {f["suggested_index"] for f in findings if f["suggested_index"]}
+        with get_db_pool().connection() as conn:
+            for statement in sorted(statements):
+                try:
+                    logging.info("Creating suggested index `%s`", statement)
+                    conn.execute(statement)
+                    conn.commit()
+                    created_indexes.append(statement)
+                except sqlite3.Error as e:
+                    logging.error(f"Error creating index `{statement}`. Error: {e}")
+        if created_indexes:
+            QUERY_PLAN_ADVISOR.clear()
+
+    return {
+        "success": True,
+        "message": f"Found {len(findings)} query shape(s) with full scans or temp B-trees.",
+        "findings": findings,
+        "created_indexes": created_indexes,
+    }
+
+
+_STEP_REFERENCE_PATTERN = re.compile(r"\$(\d+)\.([A-Za-z_]+)")
+
+
+def _resolve_step_references(value, results: list[dict]):
+    """Replaces `$<step>.<field>` references with values from earlier step results.
+
+    A value that is exactly one reference takes the referenced value as is; inside
+    longer strings, such as conditions, only integer values are substituted.
+    """
+
+    if isinstance(value, dict):
+        return {key: _resolve_step_references(v, results) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_step_references(v, results) for v in value]
+    if not isinstance(value, str):
+        return value
+
+    def lookup(match: re.Match):
+        step, field = int(match.group(1)), match.group(2)
+        if step >= len(results) or field not in results[step]:
+            raise ValueError(
+                f"Reference '{match.group(0)}' does not match an earlier step result."
+            )
+        return results[step][field]
+
+    if whole := _STEP_REFERENCE_PATTERN.fullmatch(value):
+        return lookup(whole)
+
+    def substitute(match: re.Match) -> str:
+        referenced = lookup(match)
+        if not isinstance(referenced, int):
+            raise ValueError(
+                f"Reference '{match.group(0)}' inside text must be an integer."
+            )
+        return str(referenced)
+
+    return _STEP_REFERENCE_PATTERN.sub(substitute, value)
+
+
+def _run_batch_step(conn: Connection, tool: str, args: dict) -> dict:
+    table_name = args["table_name"]
+    if tool == "insert_data":
+        if not args.get("data"):
+            raise ValueError("No data provided for insertion.")
+        query, values = _insert_query(table_name, args["data"])
+        cursor = conn.execute(query, values)
+        return {"row_id": cursor.lastrowid}
+    if tool == "delete_data":
+        condition = args.get("condition", "")
+        if not condition.strip():
+            raise ValueError("Deletion condition cannot be empty.")
+        cursor = conn.execute(_delete_query(table_name, condition))
+        return {"rows_deleted": cursor.rowcount}
+    if tool == "query_db_table":
+        query = _select_query(
+            table_name, args.get("columns") or "*", args.get("condition", "")
+        )
+        rows, remaining = _fetch_within_spill_limits(conn.execute(query))
+        if remaining is not None:
+            # Not keyed: the rows can include this batch's uncommitted writes
+            spilled = _spill_result(query, rows, remaining)
+            return {
+                "rows": spilled["rows"],
+                "count": spilled["row_count"],
+                "spilled": True,
+                "resource_uri": spilled["resource_uri"],
+            }
+        return {"rows": rows, "count": len(rows)}
+    raise ValueError(
+        f"Unsupported batch tool '{tool}'. Use insert_data, delete_data or query_db_table."
+    )
+
+
+def _discard_spilled(results: list[dict]) -> None:
+    # Results of a rolled back batch are not returned, so their files are dropped
+    for result in results:
+        if result.get("spilled"):
+            RESULT_SPILL_STORE.discard(
+                RESULT_SPILL_STORE.result_id(result["resource_uri"])
+            )
+
+
+def batch(operations: list[dict]) -> dict:
+    """Runs several database operations in order, in one all-or-nothing transaction.
+
+    Each operation is {"tool": <name>, "args": {...}} where the tool is "insert_data"
+    (args: table_name, data), "delete_data" (args: table_name, condition) or
+    "query_db_table" (args: table_name, columns, condition). Later operations can use
+    results of earlier ones with "$<index>.<field>", e.g. "$0.row_id" for the row ID
+    inserted by the first operation: {"user_id": "$0.row_id"} or "user_id = $0.row_id".
+
+    Args:
+        operations (list[dict]): The ordered operations to run.
+
+    Returns:
+        dict: A dictionary with keys 'success' (bool), 'message' (str) and 'results'
+              (list[dict]) with one result per operation. A query result too large
+              to return inline has 'spilled' (True), its first rows and the
+              'resource_uri' of the full result. If any operation fails, nothing
+              is committed and 'failed_step' holds its index.
+    """
+
+    logging.info("Batch called with `%s` operations.", LogPayload(operations))
+    if not operations:
+        return {"success": False, "message": "No operations provided.", "results": []}
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return {
+            "success": False,
+            "message": f"A batch can hold at most {MAX_BATCH_OPERATIONS} operations, got {len(operations)}.",
+            "results": [],
+        }
+
+    results: list[dict] = []
+    written_tables: set[str] = set()
+    pool = get_db_pool()
+    conn = pool.acquire()
+    try:
+        conn.execute("BEGIN;")
+        for step, operation in enumerate(operations):
+            try:
+                tool = operation.get("tool", "")
+                args = _resolve_step_references(operation.get("args") or {}, results)
+                if "table_name" not in args:
+                    raise ValueError("Missing 'table_name' argument.")
+                result = _run_batch_step(conn, tool, args)
+            except (sqlite3.Error, ValueError, AttributeError) as e:
+                conn.rollback()
+                _discard_spilled(results)
+                logging.error(f"Batch step `{step}` failed, rolled back. Error: {e}")
+                return {
+                    "success": False,
+                    "message": f"Step {step} failed and the batch was rolled back: {e}",
+                    "failed_step": step,
+                    "results": [],
+                }
+            if tool != "query_db_table":
+                written_tables.add(args["table_name"])
+            results.append({"step": step, "tool": tool, **result})
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        _discard_spilled(results)
+        logging.error(f"Error committing batch. Error: {e}")
+        return {
+            "success": False,
+            "message": f"Error committing batch: {e}",
+            "results": [],
+        }
+    finally:
+        pool.release(conn)
+
+    for table_name in written_tables:
+        bump_table_version(table_name)
+    logging.info("Batch of `%s` operations committed.", len(operations))
+    return {
+        "success": True,
+        "message": f"{len(operations)} operation(s) committed.",
+        "results": results,
+    }
@@ -1,10 +1,174 @@
 import os
+import time
+import random
 import sqlite3
+import argparse
 
-from db import DATABASE_PATH
+from itertools import islice
+from typing import Iterator
 
+from db import DATABASE_PATH, TODOS_FTS_TABLE
 
-def init_database():
+# Secondary indexes for the conditions the agent typically passes to
+# `query_db_table`, e.g. "user_id = 2", "completed = 0", "user_id = 2 AND completed = 0"
+INDEXES: dict[str, str] = {
+    "idx_todos_user_id_completed": "CREATE INDEX IF NOT EXISTS idx_todos_user_id_completed ON todos (user_id, completed)",
+    "idx_todos_completed": "CREATE INDEX IF NOT EXISTS idx_todos_completed ON todos (completed)",
+}
+
+# Full-text index over todo tasks for `search_todos`; it reads task text from
+# `todos` itself and the triggers keep it in step with every write
+FTS_STATEMENTS: tuple[str, ...] = (
+    f"CREATE VIRTUAL TABLE {TODOS_FTS_TABLE} USING fts5(task, content='todos', content_rowid='id')",
+    f"""CREATE TRIGGER IF NOT EXISTS todos_fts_insert AFTER INSERT ON todos BEGIN
+        INSERT INTO {TODOS_FTS_TABLE} (rowid, task) VALUES (new.id, new.task);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS todos_fts_delete AFTER DELETE ON todos BEGIN
+        INSERT INTO {TODOS_FTS_TABLE} ({TODOS_FTS_TABLE}, rowid, task) VALUES ('delete', old.id, old.task);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS todos_fts_update AFTER UPDATE OF task ON todos BEGIN
+        INSERT INTO {TODOS_FTS_TABLE} ({TODOS_FTS_TABLE}, rowid, task) VALUES ('delete', old.id, old.task);
+        INSERT INTO {TODOS_FTS_TABLE} (rowid, task) VALUES (new.id, new.task);
+    END""",
+)
+
+# Pragmas used only while bulk loading; durability is restored by the pool's own pragmas
+BULK_LOAD_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "cache_size": -262144,  # 256 MiB
+    "temp_store": "MEMORY",
+}
+
+TASK_VERBS = ["Buy", "Read", "Finish", "Plan", "Call", "Fix", "Review", "Book", "Clean"]
+TASK_OBJECTS = [
+    "groceries",
+    "a book",
+    "project report",
+    "weekend trip",
+    "the dentist",
+    "the bike",
+    "pull request",
+    "flight tickets",
+    "the garage",
+]
+
+
+def create_indexes(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index';")
+    existing_indexes = {row[0] for row in cursor.fetchall()}
+    for index_name, statement in INDEXES.items():
+        if index_name in existing_indexes:
+            continue
+        start = time.perf_counter()
+        cursor.execute(statement)
+        print(f"Index '{index_name}' ready in {time.perf_counter() - start:.2f}s.")
+
+
+def create_fts_index(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;",
+        (TODOS_FTS_TABLE,),
+    )
+    if cursor.fetchone():
+        return
+    start = time.perf_counter()
+    try:
+        for statement in FTS_STATEMENTS:
+            cursor.execute(statement)
+    except sqlite3.OperationalError as e:
+        print(f"Skipping full-text index, FTS5 is not available: {e}")
+        return
+    # Indexes the rows that existed before the triggers did
+    cursor.execute(
+        f"INSERT INTO {TODOS_FTS_TABLE} ({TODOS_FTS_TABLE}) VALUES ('rebuild');"
+    )
+    print(
+        f"Full-text index '{TODOS_FTS_TABLE}' ready in {time.perf_counter() - start:.2f}s."
+    )
+
+
+def _generate_users(start_id: int, count: int) -> Iterator[tuple]:
+    for user_id in range(start_id, start_id + count):
+        yield (f"user_{user_id}", f"user_{user_id}@example.com")
+
+
+def _generate_todos(
+    first_user_id: int, user_count: int, count: int, skew: float, seed: int
+) -> Iterator[tuple]:
+    rng = random.Random(seed)
+    for _ in range(count):
+        # Power-law skew: with skew > 1 a few users own most of the todos
+        user_id = first_user_id + int(user_count * rng.random() ** skew)
+        task = f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)} #{rng.randrange(10_000)}"
+        yield (user_id, task, int(rng.random() < 0.6))
+
+
+def _stream_insert(
+    conn: sqlite3.Connection,
+    query: str,
+    rows: Iterator[tuple],
+    batch_size: int,
+    label: str,
+) -> None:
+    start = time.perf_counter()
+    inserted = 0
+    while batch := list(islice(rows, batch_size)):
+        conn.executemany(query, batch)
+        conn.commit()
+        inserted += len(batch)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Inserted {inserted} {label} in {elapsed:.2f}s ({inserted / max(elapsed, 1e-9):,.0f} rows/s)."
+    )
+
+
+def generate_synthetic_data(
+    conn: sqlite3.Connection,
+    users: int,
+    todos: int,
+    skew: float = 2.0,
+    batch_size: int = 100_000,
+    seed: int = 42,
+) -> None:
+    """Appends `users` users and `todos` skewed todos, streamed in large transactions."""
+
+    for pragma, value in BULK_LOAD_PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value};")
+
+    first_user_id = conn.execute(
+        "SELECT COALESCE(MAX(id), 0) + 1 FROM users"
+    ).fetchone()[0]
+    if users:
+        _stream_insert(
+            conn,
+            "INSERT INTO users (username, email) VALUES (?, ?)",
+            _generate_users(first_user_id, users),
+            batch_size,
+            "users",
+        )
+    if todos and not users:
+        user_count = first_user_id - 1
+        first_user_id = 1
+    else:
+        user_count = users
+    if todos and user_count:
+        _stream_insert(
+            conn,
+            "INSERT INTO todos (user_id, task, completed) VALUES (?, ?, ?)",
+            _generate_todos(first_user_id, user_count, todos, skew, seed),
+            batch_size,
+            "todos",
+        )
+
+
+def init_database(
+    users: int = 0,
+    todos: int = 0,
+    skew: float = 2.0,
+    batch_size: int = 100_000,
+    seed: int = 42,
+):
     # Check if the database already exists
     db_exists = os.path.exists(DATABASE_PATH)
 
@@ -65,11 +229,40 @@ def init_database():
 
         conn.commit()
         print("Database created and populated successfully.")
-    else:
+    elif not (users or todos):
         print(f"Database already exists at {DATABASE_PATH}. No changes made.")
 
+    if users or todos:
+        print(f"Generating {users} synthetic users and {todos} synthetic todos...")
+        generate_synthetic_data(conn, users, todos, skew, batch_size, seed)
+
+    # Indexes are built after any bulk load, which is faster than maintaining them row by row
+    create_indexes(cursor)
+    create_fts_index(cursor)
+    if users or todos:
+        start = time.perf_counter()
+        cursor.execute("ANALYZE;")
+        print(f"Analyzed database in {time.perf_counter() - start:.2f}s.")
+    conn.commit()
     conn.close()
 
 
 if __name__ == "__main__":
-    init_database()
+    parser = argparse.ArgumentParser(
+        description="Create the SQLite database, optionally with synthetic data."
+    )
+    parser.add_argument("--users", type=int, default=0, help="Synthetic users to add.")
+    parser.add_argument("--todos", type=int, default=0, help="Synthetic todos to add.")
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=2.0,
+        help="Todo ownership skew; 1 is uniform, higher concentrates todos on fewer users.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100_000, help="Rows per transaction."
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    init_database(args.users, args.todos, args.skew, args.batch_size, args.seed)
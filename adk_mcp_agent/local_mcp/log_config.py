@@ -0,0 +1,107 @@
+import os
+import queue
+import random
+import reprlib
+import logging
+import logging.handlers
+
+
+# Logging setup: verbosity, per-level sampling and payload size come from env
+LOG_LEVEL: str = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+LOG_PAYLOAD_MAX_CHARS: int = int(os.getenv("MCP_LOG_PAYLOAD_MAX_CHARS", "512"))
+LOG_SAMPLE_RATES: dict[int, float] = {
+    logging.DEBUG: float(os.getenv("MCP_LOG_SAMPLE_DEBUG", "1.0")),
+    logging.INFO: float(os.getenv("MCP_LOG_SAMPLE_INFO", "1.0")),
+}
+LOG_FORMAT: str = (
+    "%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+)
+
+# Bounds the work of rendering large results, not just the length of the output
+_PAYLOAD_REPR = reprlib.Repr()
+_PAYLOAD_REPR.maxlevel = 4
+_PAYLOAD_REPR.maxdict = _PAYLOAD_REPR.maxlist = _PAYLOAD_REPR.maxtuple = 20
+_PAYLOAD_REPR.maxstring = _PAYLOAD_REPR.maxother = LOG_PAYLOAD_MAX_CHARS
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+class LogPayload:
+    """Defers `repr` of a tool argument or result until the record is queued.
+
+    Passed as a `%s` argument, so nothing is formatted for records that are
+    filtered out, and the output is capped at `max_chars`.
+    """
+
+    __slots__ = ("payload", "max_chars")
+
+    def __init__(self, payload, max_chars: int = LOG_PAYLOAD_MAX_CHARS) -> None:
+        self.payload = payload
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        text = _PAYLOAD_REPR.repr(self.payload)
+        if len(text) <= self.max_chars:
+            return text
+        return f"{text[: self.max_chars]}... <{len(text) - self.max_chars} more chars>"
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a random fraction of records per level; WARNING and above always pass."""
+
+    def __init__(self, sample_rates: dict[int, float]) -> None:
+        super().__init__()
+        self.sample_rates = sample_rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.sample_rates.get(record.levelno, 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    # The stock handler formats the message in the calling thread; the queue
+    # never leaves this process, so formatting is left to the listener thread.
+    # Payloads are the exception: the rows and dicts they hold can change once
+    # the call returns, so their bounded repr is taken before queueing
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if isinstance(record.args, tuple) and any(
+            isinstance(arg, LogPayload) for arg in record.args
+        ):
+            record.args = tuple(
+                str(arg) if isinstance(arg, LogPayload) else arg
+                for arg in record.args
+            )
+        return record
+
+
+def configure_logging(log_file_path: str) -> None:
+    """Routes the root logger through a queue to a file written by a background thread."""
+
+    global _listener
+    if _listener is not None:
+        return
+
+    file_handler = logging.FileHandler(log_file_path, mode="w")
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATES))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.handlers = [queue_handler]
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flushes queued records to the file and stops the background writer."""
+
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
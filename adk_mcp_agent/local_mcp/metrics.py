@@ -0,0 +1,221 @@
+import os
+import time
+import bisect
+import asyncio
+import logging
+import threading
+
+from contextlib import asynccontextmanager
+
+from db import QUERY_CACHE, get_db_pool
+from result_spill import RESULT_SPILL_STORE
+
+
+# Metrics setup: the Prometheus text dump is skipped when no file is configured
+METRICS_FILE_PATH: str = os.getenv("MCP_METRICS_FILE", "")
+METRICS_DUMP_INTERVAL_SECONDS: float = float(
+    os.getenv("MCP_METRICS_DUMP_INTERVAL", "15")
+)
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+LATENCY_PHASES: tuple[str, ...] = ("db", "serialize", "total")
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; observing is one bisect and two additions."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_SECONDS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(LATENCY_BUCKETS_SECONDS + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {"count": self.count, "sum_seconds": self.sum, "buckets": buckets}
+
+
+class ToolMetrics:
+    """Per-tool call, error, row and byte counters plus latency histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict] = {}
+        self.started_at = time.time()
+
+    def _tool(self, tool_name: str) -> dict:
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            tool = self._tools[tool_name] = {
+                "calls": 0,
+                "errors": 0,
+                "rows": 0,
+                "response_bytes": 0,
+                "latency": {phase: LatencyHistogram() for phase in LATENCY_PHASES},
+            }
+        return tool
+
+    def observe(
+        self,
+        tool_name: str,
+        db_seconds: float,
+        serialize_seconds: float,
+        total_seconds: float,
+        rows: int,
+        response_bytes: int,
+        error: bool,
+    ) -> None:
+        with self._lock:
+            tool = self._tool(tool_name)
+            tool["calls"] += 1
+            tool["errors"] += int(error)
+            tool["rows"] += rows
+            tool["response_bytes"] += response_bytes
+            tool["latency"]["db"].observe(db_seconds)
+            tool["latency"]["serialize"].observe(serialize_seconds)
+            tool["latency"]["total"].observe(total_seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                tool_name: {
+                    **{key: value for key, value in tool.items() if key != "latency"},
+                    "latency": {
+                        phase: histogram.snapshot()
+                        for phase, histogram in tool["latency"].items()
+                    },
+                }
+                for tool_name, tool in self._tools.items()
+            }
+
+    def to_prometheus(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+
+        snapshot = self.snapshot()
+        lines = []
+        for metric, help_text in (
+            ("calls", "Tool calls handled."),
+            ("errors", "Tool calls that raised or returned success=false."),
+            ("rows", "Rows returned by tool calls."),
+            ("response_bytes", "Bytes of encoded tool responses."),
+        ):
+            lines.append(f"# HELP mcp_tool_{metric}_total {help_text}")
+            lines.append(f"# TYPE mcp_tool_{metric}_total counter")
+            for tool_name, tool in snapshot.items():
+                lines.append(
+                    f'mcp_tool_{metric}_total{{tool="{tool_name}"}} {tool[metric]}'
+                )
+
+        lines.append("# HELP mcp_tool_latency_seconds Tool call latency by phase.")
+        lines.append("# TYPE mcp_tool_latency_seconds histogram")
+        for tool_name, tool in snapshot.items():
+            for phase, histogram in tool["latency"].items():
+                labels = f'tool="{tool_name}",phase="{phase}"'
+                for bound, count in histogram["buckets"].items():
+                    lines.append(
+                        f'mcp_tool_latency_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f"mcp_tool_latency_seconds_sum{{{labels}}} {histogram['sum_seconds']}"
+                )
+                lines.append(
+                    f"mcp_tool_latency_seconds_count{{{labels}}} {histogram['count']}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def dump(self, file_path: str) -> None:
+        # Written to a temp file and renamed so scrapers never read a partial dump
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w") as metrics_file:
+            metrics_file.write(self.to_prometheus())
+        os.replace(temp_path, file_path)
+
+
+METRICS = ToolMetrics()
+
+
+def count_result_rows(payload) -> int:
+    """Counts the rows in a tool result, whichever result shape the tool returns."""
+
+    if isinstance(payload, list):
+        return len(payload)
+    if isinstance(payload, dict):
+        if isinstance(payload.get("row_count"), int):
+            return payload["row_count"]
+        for key in ("rows", "tables", "columns", "findings", "results"):
+            if isinstance(payload.get(key), list):
+                return len(payload[key])
+    return 0
+
+
+@asynccontextmanager
+async def periodic_metrics_dump(
+    file_path: str = METRICS_FILE_PATH,
+    interval: float = METRICS_DUMP_INTERVAL_SECONDS,
+):
+    """Dumps METRICS to `file_path` every `interval` seconds while the block runs."""
+
+    async def _dump_forever() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                METRICS.dump(file_path)
+            except OSError as e:
+                logging.error(f"Error dumping metrics to `{file_path}`. Error: {e}")
+
+    if not file_path or interval <= 0:
+        yield
+        return
+
+    logging.info(f"Dumping metrics to `{file_path}` every `{interval}s`.")
+    task = asyncio.create_task(_dump_forever())
+    try:
+        yield
+    finally:
+        task.cancel()
+        METRICS.dump(file_path)
+
+
+def server_stats(dummy_param: str) -> dict:
+    """Reports per-tool call counts, errors, latency histograms and cache statistics.
+
+    Args:
+        dummy_param (str): This parameter is not used by the function
+                           but helps ensure schema generation. A non-empty string is expected.
+    Returns:
+        dict: A dictionary with keys 'uptime_seconds' (float), 'tools' (dict) with the
+              metrics of each tool, 'query_cache' (dict), 'spilled_results' (dict)
+              and 'connection_pool' (dict).
+    """
+
+    pool = get_db_pool()
+    return {
+        "uptime_seconds": round(time.time() - METRICS.started_at, 3),
+        "tools": METRICS.snapshot(),
+        "query_cache": QUERY_CACHE.stats(),
+        "spilled_results": RESULT_SPILL_STORE.stats(),
+        "connection_pool": {"size": pool.size, "open_connections": pool.opened},
+    }
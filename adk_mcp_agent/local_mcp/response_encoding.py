@@ -0,0 +1,57 @@
+import os
+import json
+import logging
+
+from typing import Any
+
+
+# Response format setup: "pretty" keeps the original indented per-row dicts,
+# "compact" sends row lists as columns + rows without whitespace
+RESPONSE_FORMAT_PRETTY: str = "pretty"
+RESPONSE_FORMAT_COMPACT: str = "compact"
+RESPONSE_FORMAT: str = os.getenv("MCP_RESPONSE_FORMAT", RESPONSE_FORMAT_PRETTY).lower()
+
+# Built once: json.dumps creates a new encoder on every call with non-default options
+_COMPACT_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, check_circular=False
+)
+
+
+def to_columnar(rows: list[dict]) -> dict | list[dict]:
+    """Converts a list of same-keyed row dicts into `{columns, rows}` form.
+
+    Lists whose rows don't share one key set are returned unchanged.
+    """
+
+    if not rows or not all(isinstance(row, dict) for row in rows):
+        return rows
+    columns = list(rows[0].keys())
+    column_set = set(columns)
+    if any(row.keys() != column_set for row in rows):
+        return rows
+    return {
+        "columns": columns,
+        "rows": [[row[name] for name in columns] for row in rows],
+    }
+
+
+def _compact_payload(payload: Any) -> Any:
+    if isinstance(payload, list):
+        return to_columnar(payload)
+    if isinstance(payload, dict) and isinstance(payload.get("rows"), list):
+        columnar = to_columnar(payload["rows"])
+        if isinstance(columnar, dict):
+            return {**payload, "rows": columnar["rows"], "columns": columnar["columns"]}
+    return payload
+
+
+def encode_tool_response(payload: Any, response_format: str = RESPONSE_FORMAT) -> str:
+    """Serializes a tool result for an MCP `TextContent` in the requested format."""
+
+    if response_format == RESPONSE_FORMAT_COMPACT:
+        return _COMPACT_ENCODER.encode(_compact_payload(payload))
+    if response_format != RESPONSE_FORMAT_PRETTY:
+        logging.warning(
+            f"Unknown response format `{response_format}`, falling back to `{RESPONSE_FORMAT_PRETTY}`."
+        )
+    return json.dumps(payload, indent=2)
@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import shutil
+import logging
+import tempfile
+import threading
+
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable
+
+
+# Result spill setup: results over either limit are written to a file and exposed
+# as an MCP resource instead of being returned inline; 0 disables a limit
+SPILL_MAX_ROWS: int = int(os.getenv("MCP_SPILL_MAX_ROWS", "1000"))
+SPILL_MAX_BYTES: int = int(os.getenv("MCP_SPILL_MAX_BYTES", str(1024 * 1024)))
+SPILL_PREVIEW_ROWS: int = int(os.getenv("MCP_SPILL_PREVIEW_ROWS", "20"))
+SPILL_DIR: str = os.getenv("MCP_SPILL_DIR", "")
+SPILL_MAX_FILES: int = int(os.getenv("MCP_SPILL_MAX_FILES", "32"))
+SPILL_MAX_TOTAL_BYTES: int = int(
+    os.getenv("MCP_SPILL_MAX_TOTAL_BYTES", str(512 * 1024 * 1024))
+)
+SPILL_TTL_SECONDS: float = float(os.getenv("MCP_SPILL_TTL", "900"))
+SPILL_URI_SCHEME: str = "query-result"
+SPILL_MIME_TYPE: str = "application/x-ndjson"
+
+# Rows are written this many at a time, so a spill never holds the whole result
+_WRITE_CHUNK_ROWS = 1000
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+class ResultSpillStore:
+    """Temp files holding large query results, one JSON row per line.
+
+    A result spilled with a `key` is stored under it, so spilling the same
+    key again reuses the file instead of writing a copy. Files are evicted
+    least recently used first once there are more than `max_files` of them
+    or they take more than `max_total_bytes`, and are deleted `ttl_seconds`
+    after they were last read.
+    """
+
+    def __init__(
+        self,
+        directory: str = SPILL_DIR,
+        max_files: int = SPILL_MAX_FILES,
+        max_total_bytes: int = SPILL_MAX_TOTAL_BYTES,
+        ttl_seconds: float = SPILL_TTL_SECONDS,
+    ) -> None:
+        self.directory = directory
+        self.max_files = max_files
+        self.max_total_bytes = max_total_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # A directory we created ourselves is removed again on close
+        self._owns_directory = not directory
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.evictions = 0
+
+    def _directory(self) -> str:
+        # Locked so concurrent first spills do not each create a directory
+        with self._lock:
+            if not self.directory:
+                self.directory = tempfile.mkdtemp(prefix="mcp-spill-")
+            directory = self.directory
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    @staticmethod
+    def key_id(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def uri(result_id: str) -> str:
+        return f"{SPILL_URI_SCHEME}://{result_id}"
+
+    @staticmethod
+    def result_id(uri: str) -> str | None:
+        prefix = f"{SPILL_URI_SCHEME}://"
+        if not uri.startswith(prefix):
+            return None
+        return uri[len(prefix) :].split("?", 1)[0].rstrip("/")
+
+    def get(self, key: str) -> dict | None:
+        """Returns the entry spilled under `key`, or None if there is none."""
+
+        result_id = self.key_id(key)
+        with self._lock:
+            now = time.monotonic()
+            self._evict_locked(now)
+            entry = self._entries.get(result_id)
+            if entry is None:
+                return None
+            entry["last_used"] = now
+            self._entries.move_to_end(result_id)
+            return dict(entry)
+
+    def spill(self, rows: Iterable[dict], description: str = "", key: str = "") -> dict:
+        """Writes `rows` to a spill file in chunks and returns its entry.
+
+        With a `key` already spilled, the existing entry is returned instead.
+        """
+
+        if key and (entry := self.get(key)) is not None:
+            return entry
+        result_id = self.key_id(key) if key else uuid.uuid4().hex
+        path = os.path.join(self._directory(), f"{result_id}.jsonl")
+        # Written under a unique name first, so equal keys spilled at once do not
+        # write to the same file
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        row_count = 0
+        rows = iter(rows)
+        try:
+            with open(temp_path, "w", encoding="utf-8") as spill_file:
+                while chunk := list(islice(rows, _WRITE_CHUNK_ROWS)):
+                    spill_file.writelines(
+                        _ROW_ENCODER.encode(row) + "\n" for row in chunk
+                    )
+                    row_count += len(chunk)
+        except BaseException:
+            self._remove_file(temp_path)
+            raise
+
+        now = time.monotonic()
+        entry = {
+            "id": result_id,
+            "uri": self.uri(result_id),
+            "path": path,
+            "rows": row_count,
+            "bytes": os.path.getsize(temp_path),
+            "description": description,
+            "created_at": time.time(),
+            "last_used": now,
+        }
+        with self._lock:
+            if result_id in self._entries:
+                self._remove_file(temp_path)
+                existing = self._entries[result_id]
+                existing["last_used"] = now
+                self._entries.move_to_end(result_id)
+                return dict(existing)
+            os.replace(temp_path, path)
+            self._entries[result_id] = entry
+            self._bytes += entry["bytes"]
+            self._evict_locked(now)
+        logging.info(
+            "Spilled `%s` rows (`%s` bytes) to `%s`.", row_count, entry["bytes"], path
+        )
+        return dict(entry)
+
+    def read(self, result_id: str, offset: int = 0, limit: int = 0) -> str:
+        """Returns the JSON lines of rows [offset, offset + limit); limit 0 reads to the end."""
+
+        with self._lock:
+            self._evict_locked(time.monotonic())
+            entry = self._entries.get(result_id)
+            if entry is None:
+                raise KeyError(f"Result '{result_id}' not found or expired.")
+            entry["last_used"] = time.monotonic()
+            self._entries.move_to_end(result_id)
+            path = entry["path"]
+
+        # Another caller may evict the entry and delete its file once the lock is released
+        try:
+            with open(path, encoding="utf-8") as spill_file:
+                stop = offset + limit if limit > 0 else None
+                return "".join(islice(spill_file, offset, stop))
+        except FileNotFoundError:
+            raise KeyError(f"Result '{result_id}' not found or expired.") from None
+
+    def discard(self, result_id: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(result_id, None)
+            if entry is not None:
+                self._bytes -= entry["bytes"]
+                self._remove_file(entry["path"])
+
+    def entries(self) -> list[dict]:
+        with self._lock:
+            self._evict_locked(time.monotonic())
+            return [dict(entry) for entry in self._entries.values()]
+
+    def _evict_locked(self, now: float) -> None:
+        while self._entries:
+            result_id, entry = next(iter(self._entries.items()))
+            expired = now - entry["last_used"] > self.ttl_seconds
+            # The newest file is kept even when it alone exceeds the byte budget
+            over_budget = len(self._entries) > 1 and (
+                len(self._entries) > self.max_files
+                or self._bytes > self.max_total_bytes
+            )
+            if not (expired or over_budget):
+                break
+            del self._entries[result_id]
+            self._bytes -= entry["bytes"]
+            self.evictions += 1
+            self._remove_file(entry["path"])
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.error(f"Error removing spill file `{path}`. Error: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "files": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                self._remove_file(entry["path"])
+            self._entries.clear()
+            self._bytes = 0
+        if self._owns_directory and self.directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = ""
+
+
+RESULT_SPILL_STORE = ResultSpillStore()
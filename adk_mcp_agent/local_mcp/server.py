@@ -1,9 +1,15 @@
 import asyncio
+import argparse
+import contextlib
 import json
 import os
+import time
 import logging
 
+from urllib.parse import parse_qs, urlsplit
+
 import mcp.server.stdio
+from pydantic import AnyUrl
 
 # ADK Tool Imports
 from google.adk.tools.function_tool import FunctionTool
@@ -12,46 +18,72 @@ from google.adk.tools.mcp_tool.conversion_utils import adk_to_mcp_tool_type
 # MCP Server Imports
 from mcp import types as mcp_types
 from mcp.server.lowlevel import Server, NotificationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.models import InitializationOptions
 
 from db import (
+    aggregate_table,
+    batch,
+    close_db_pool,
     delete_data,
+    get_index_advice,
     get_table_schema,
     insert_data,
+    insert_many,
     list_db_tables,
     query_db_table,
+    query_db_table_page,
+    search_todos,
 )
+from log_config import LogPayload, configure_logging, stop_logging
+from metrics import METRICS, count_result_rows, periodic_metrics_dump, server_stats
+from response_encoding import encode_tool_response
+from result_spill import RESULT_SPILL_STORE, SPILL_MIME_TYPE
+from tool_executor import ToolExecutor
 
-# Logging setup
-LOG_FILE_PATH: str = os.path.join(os.path.dirname(__file__), "mcp_server.log")
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-    handlers=[logging.FileHandler(LOG_FILE_PATH, mode="w")],
+# Logging setup: records are queued and written to the file by a background thread
+LOG_FILE_PATH: str = os.getenv(
+    "MCP_LOG_FILE", os.path.join(os.path.dirname(__file__), "mcp_server.log")
 )
+configure_logging(LOG_FILE_PATH)
+
+# Transport setup: stdio serves one client, http serves many from one process
+TRANSPORT: str = os.getenv("MCP_TRANSPORT", "stdio")
+HTTP_HOST: str = os.getenv("MCP_HTTP_HOST", "127.0.0.1")
+HTTP_PORT: int = int(os.getenv("MCP_HTTP_PORT", "8765"))
+HTTP_MAX_CONNECTIONS: int = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "64"))
 
 # MCP server setup
 logging.info("Creating MCP server instance for SQLite DB...")
 app = Server("sqlite-db-mcp-server")
 
+# Blocking sqlite calls run on a bounded worker pool, off the event loop
+TOOL_EXECUTOR = ToolExecutor()
+
 # Warp database utility functions as ADK Function Tools
 ADK_DB_TOOLS = {
-    "list_db_tables": FunctionTool(func=list_db_tables),
-    "get_table_schema": FunctionTool(func=get_table_schema),
-    "query_db_table": FunctionTool(func=query_db_table),
-    "insert_data": FunctionTool(func=insert_data),
-    "delete_data": FunctionTool(func=delete_data),
+    "list_db_tables": FunctionTool(func=TOOL_EXECUTOR.offload(list_db_tables)),
+    "get_table_schema": FunctionTool(func=TOOL_EXECUTOR.offload(get_table_schema)),
+    "query_db_table": FunctionTool(func=TOOL_EXECUTOR.offload(query_db_table)),
+    "query_db_table_page": FunctionTool(
+        func=TOOL_EXECUTOR.offload(query_db_table_page)
+    ),
+    "search_todos": FunctionTool(func=TOOL_EXECUTOR.offload(search_todos)),
+    "aggregate_table": FunctionTool(func=TOOL_EXECUTOR.offload(aggregate_table)),
+    "insert_data": FunctionTool(func=TOOL_EXECUTOR.offload(insert_data)),
+    "insert_many": FunctionTool(func=TOOL_EXECUTOR.offload(insert_many)),
+    "delete_data": FunctionTool(func=TOOL_EXECUTOR.offload(delete_data)),
+    "batch": FunctionTool(func=TOOL_EXECUTOR.offload(batch)),
+    "server_stats": FunctionTool(func=server_stats),
+    "get_index_advice": FunctionTool(func=TOOL_EXECUTOR.offload(get_index_advice)),
 }
 
 
-@app.list_tools()
-async def list_mcp_tools() -> list[mcp_types.Tool]:
-    """MCP handler to list tools this server exposes."""
+def build_mcp_tool_list(tools: dict[str, FunctionTool]) -> tuple[mcp_types.Tool, ...]:
+    """Converts the ADK tool registry into the MCP tool list advertised to clients."""
 
-    logging.info("MCP Server: Received list_tools request.")
     mcp_tools_list = []
-
-    for tool_name, adk_tool_instance in ADK_DB_TOOLS.items():
+    for tool_name, adk_tool_instance in tools.items():
         if not adk_tool_instance.name:
             adk_tool_instance.name = tool_name
 
@@ -61,6 +93,44 @@ async def list_mcp_tools() -> list[mcp_types.Tool]:
         )
         mcp_tools_list.append(mcp_tool_schema)
 
+    return tuple(mcp_tools_list)
+
+
+def _tool_registry_fingerprint() -> tuple:
+    return tuple((name, id(tool)) for name, tool in ADK_DB_TOOLS.items())
+
+
+def refresh_mcp_tool_list() -> None:
+    """Rebuilds the advertised tool list, e.g. after ADK_DB_TOOLS was changed."""
+
+    global MCP_TOOL_LIST, _mcp_tool_list_fingerprint
+    start = time.perf_counter()
+    MCP_TOOL_LIST = build_mcp_tool_list(ADK_DB_TOOLS)
+    _mcp_tool_list_fingerprint = _tool_registry_fingerprint()
+    logging.info(
+        f"MCP Server: Built list of `{len(MCP_TOOL_LIST)}` tools in `{(time.perf_counter() - start) * 1e3:.2f}` ms."
+    )
+
+
+# Built once at startup and served from memory on every list_tools request
+MCP_TOOL_LIST: tuple[mcp_types.Tool, ...] = ()
+_mcp_tool_list_fingerprint: tuple = ()
+refresh_mcp_tool_list()
+
+
+@app.list_tools()
+async def list_mcp_tools() -> list[mcp_types.Tool]:
+    """MCP handler to list tools this server exposes."""
+
+    start = time.perf_counter()
+    if _tool_registry_fingerprint() != _mcp_tool_list_fingerprint:
+        logging.info("MCP Server: Tool registry changed, rebuilding tool list.")
+        refresh_mcp_tool_list()
+
+    mcp_tools_list = list(MCP_TOOL_LIST)
+    logging.info(
+        f"MCP Server: Served list_tools request with `{len(mcp_tools_list)}` tools in `{(time.perf_counter() - start) * 1e6:.1f}` us."
+    )
     return mcp_tools_list
 
 
@@ -69,23 +139,39 @@ async def call_mcp_tool(name: str, arguments: dict) -> list[mcp_types.TextConten
     """MCP handler to execute a tool call requested by an MCP client."""
 
     logging.info(
-        f"MCP Server: Received call_tool request for '{name}' with args: {arguments}"
+        "MCP Server: Received call_tool request for '%s' with args: %s",
+        name,
+        LogPayload(arguments),
     )
 
     if name in ADK_DB_TOOLS:
         adk_tool_instance = ADK_DB_TOOLS[name]
+        start = time.perf_counter()
+        db_seconds = serialize_seconds = 0.0
+        rows, error, response_text = 0, True, ""
         try:
             adk_tool_response = await adk_tool_instance.run_async(
                 args=arguments,
                 tool_context=None,  # type: ignore
             )
+            db_seconds = time.perf_counter() - start
             logging.info(
-                f"MCP Server: ADK tool '{name}' executed. Response: {adk_tool_response}"
+                "MCP Server: ADK tool '%s' executed. Response: %s",
+                name,
+                LogPayload(adk_tool_response),
+            )
+            rows = count_result_rows(adk_tool_response)
+            error = (
+                isinstance(adk_tool_response, dict)
+                and adk_tool_response.get("success") is False
             )
-            response_text = json.dumps(adk_tool_response, indent=2)
+            serialize_start = time.perf_counter()
+            response_text = encode_tool_response(adk_tool_response)
+            serialize_seconds = time.perf_counter() - serialize_start
             return [mcp_types.TextContent(type="text", text=response_text)]
 
         except Exception as e:
+            db_seconds = db_seconds or time.perf_counter() - start
             logging.error(
                 f"MCP Server: Error executing ADK tool '{name}': {e}", exc_info=True
             )
@@ -93,8 +179,19 @@ async def call_mcp_tool(name: str, arguments: dict) -> list[mcp_types.TextConten
                 "success": False,
                 "message": f"Failed to execute tool '{name}': {str(e)}",
             }
-            error_text = json.dumps(error_payload)
-            return [mcp_types.TextContent(type="text", text=error_text)]
+            response_text = json.dumps(error_payload)
+            return [mcp_types.TextContent(type="text", text=response_text)]
+
+        finally:
+            METRICS.observe(
+                name,
+                db_seconds,
+                serialize_seconds,
+                time.perf_counter() - start,
+                rows,
+                len(response_text.encode("utf-8")),
+                error,
+            )
     else:
         logging.warning(f"MCP Server: Tool '{name}' not found/exposed by this server.")
         error_payload = {
@@ -105,36 +202,135 @@ async def call_mcp_tool(name: str, arguments: dict) -> list[mcp_types.TextConten
         return [mcp_types.TextContent(type="text", text=error_text)]
 
 
+@app.list_resources()
+async def list_mcp_resources() -> list[mcp_types.Resource]:
+    """MCP handler to list the large query results saved as resources."""
+
+    return [
+        mcp_types.Resource(
+            uri=entry["uri"],
+            name=f"Query result {entry['id']}",
+            description=f"{entry['rows']} rows of `{entry['description']}`",
+            mimeType=SPILL_MIME_TYPE,
+            size=entry["bytes"],
+        )
+        for entry in RESULT_SPILL_STORE.entries()
+    ]
+
+
+@app.read_resource()
+async def read_mcp_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    """MCP handler to read a saved query result, one JSON row per line.
+
+    `?offset=N&limit=M` in the URI reads only rows [N, N + M) of the result.
+    """
+
+    result_id = RESULT_SPILL_STORE.result_id(str(uri))
+    if result_id is None:
+        raise ValueError(f"Resource '{uri}' not found.")
+    query = parse_qs(urlsplit(str(uri)).query)
+    offset = int(query.get("offset", ["0"])[0])
+    limit = int(query.get("limit", ["0"])[0])
+    logging.info(
+        "MCP Server: Reading resource `%s` rows from `%s`, limit `%s`.",
+        result_id,
+        offset,
+        limit,
+    )
+    content = await asyncio.to_thread(RESULT_SPILL_STORE.read, result_id, offset, limit)
+    return [ReadResourceContents(content=content, mime_type=SPILL_MIME_TYPE)]
+
+
 # MCP Server Runner
 async def run_mcp_stdio_server():
     """Runs the MCP server, listening for connections over standard input/output."""
 
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         logging.info("MCP Stdio Server: Starting handshake with client...")
-        await app.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name=app.name,
-                server_version="0.1.0",
-                capabilities=app.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+        async with periodic_metrics_dump():
+            await app.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name=app.name,
+                    server_version="0.1.0",
+                    capabilities=app.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
         logging.info("MCP Stdio Server: Run loop finished or client disconnected.")
 
 
+# Streamable HTTP Runner
+async def run_mcp_http_server(
+    host: str = HTTP_HOST,
+    port: int = HTTP_PORT,
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+):
+    """Runs the MCP server over streamable HTTP, serving many clients from one process.
+
+    All sessions share this process's connection pool, caches and worker pool.
+    Requests beyond `max_connections` concurrent connections get a 503.
+    """
+
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+    session_manager = StreamableHTTPSessionManager(app=app, json_response=False)
+
+    async def handle_streamable_http(scope, receive, send) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: Starlette):
+        async with session_manager.run(), periodic_metrics_dump():
+            logging.info(
+                f"MCP HTTP Server: Listening on http://{host}:{port}/mcp (max connections {max_connections})."
+            )
+            yield
+            logging.info("MCP HTTP Server: Session manager shutting down.")
+
+    starlette_app = Starlette(
+        routes=[Mount("/mcp", app=handle_streamable_http)], lifespan=lifespan
+    )
+    config = uvicorn.Config(
+        starlette_app,
+        host=host,
+        port=port,
+        limit_concurrency=max_connections,
+        log_config=None,  # keep uvicorn on the server's queued logging
+    )
+    await uvicorn.Server(config).serve()
+
+
 if __name__ == "__main__":
-    logging.info("Launching SQLite DB MCP Server via stdio...")
+    parser = argparse.ArgumentParser(description="SQLite DB MCP Server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default=TRANSPORT)
+    parser.add_argument("--host", default=HTTP_HOST)
+    parser.add_argument("--port", type=int, default=HTTP_PORT)
+    parser.add_argument("--max-connections", type=int, default=HTTP_MAX_CONNECTIONS)
+    args = parser.parse_args()
+
+    logging.info(f"Launching SQLite DB MCP Server via {args.transport}...")
     try:
-        asyncio.run(run_mcp_stdio_server())
+        if args.transport == "http":
+            asyncio.run(run_mcp_http_server(args.host, args.port, args.max_connections))
+        else:
+            asyncio.run(run_mcp_stdio_server())
     except KeyboardInterrupt:
-        logging.info("\nMCP Server (stdio) stopped by user.")
+        logging.info(f"\nMCP Server ({args.transport}) stopped by user.")
     except Exception as e:
         logging.error(
-            f"MCP Server (stdio) encountered an unhandled error: {e}", exc_info=True
+            f"MCP Server ({args.transport}) encountered an unhandled error: {e}",
+            exc_info=True,
         )
     finally:
-        logging.info("MCP Server (stdio) process exiting.")
+        TOOL_EXECUTOR.shutdown()
+        close_db_pool()
+        RESULT_SPILL_STORE.close()
+        logging.info(f"MCP Server ({args.transport}) process exiting.")
+        stop_logging()
@@ -0,0 +1,77 @@
+"""Run with: python -m unittest test_tool_executor (from adk_mcp_agent/local_mcp)."""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from tool_executor import TOOL_CONCURRENCY_GROUPS, ToolExecutor
+
+SCAN_SECONDS: float = 0.5
+
+
+class ScanSaturationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.executor = ToolExecutor(
+            max_workers=4,
+            concurrency_limits={"scan": 2},
+            concurrency_groups=TOOL_CONCURRENCY_GROUPS,
+        )
+        self.release_scans = threading.Event()
+
+    async def asyncTearDown(self) -> None:
+        self.release_scans.set()
+        self.executor.shutdown()
+
+    def _scan(self) -> None:
+        self.release_scans.wait(SCAN_SECONDS)
+
+    async def test_lookup_is_not_queued_behind_scans(self) -> None:
+        # More scans than workers, spread over every tool in the scan group,
+        # batches included
+        scan_tools = [
+            tool for tool, group in TOOL_CONCURRENCY_GROUPS.items() if group == "scan"
+        ]
+        self.assertIn("batch", scan_tools)
+        self.assertIn("search_todos", scan_tools)
+        scans = [
+            asyncio.create_task(self.executor.run(tool, self._scan))
+            for tool in scan_tools
+            for _ in range(self.executor.max_workers)
+        ]
+        await asyncio.sleep(0.05)
+
+        start = time.perf_counter()
+        await self.executor.run("get_table_schema", lambda: None)
+        lookup_seconds = time.perf_counter() - start
+
+        self.release_scans.set()
+        await asyncio.gather(*scans)
+        self.assertLess(lookup_seconds, SCAN_SECONDS / 5)
+
+    async def test_scan_tools_share_one_limit(self) -> None:
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def scan() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(
+            *(
+                self.executor.run(tool, scan)
+                for tool in TOOL_CONCURRENCY_GROUPS
+                for _ in range(4)
+            )
+        )
+        self.assertEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import asyncio
+import logging
+import threading
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from db import POOL_SIZE, get_db_pool
+
+
+# Worker pool setup
+WORKER_THREADS: int = int(os.getenv("MCP_WORKER_THREADS", str(POOL_SIZE)))
+DEFAULT_TOOL_TIMEOUT_SECONDS: float = float(os.getenv("MCP_TOOL_TIMEOUT", "30"))
+
+# Tools that may run long scans share one "scan" limit below the worker count, so
+# lookups and writes still find a free worker however many scans are queued. A
+# batch can hold any of those scans, so it counts as one too
+TOOL_CONCURRENCY_GROUPS: dict[str, str] = {
+    "query_db_table": "scan",
+    "query_db_table_page": "scan",
+    "aggregate_table": "scan",
+    "search_todos": "scan",
+    "batch": "scan",
+}
+TOOL_CONCURRENCY_LIMITS: dict[str, int] = {
+    "scan": max(1, WORKER_THREADS // 2),
+}
+TOOL_TIMEOUTS_SECONDS: dict[str, float] = {}
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a tool call does not finish within its timeout."""
+
+
+class ToolExecutor:
+    """Runs blocking DB tool functions on a bounded worker thread pool.
+
+    Every tool gets its own timeout and concurrency limit, except that tools in
+    the same concurrency group share one limit. When a call times out or is
+    cancelled, the statement running on its pooled connection is interrupted
+    so the worker is freed instead of finishing in the background.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = WORKER_THREADS,
+        concurrency_limits: dict[str, int] | None = None,
+        concurrency_groups: dict[str, str] | None = None,
+        timeouts: dict[str, float] | None = None,
+        default_timeout: float = DEFAULT_TOOL_TIMEOUT_SECONDS,
+    ) -> None:
+        self.max_workers = max_workers
+        self.concurrency_limits = (
+            TOOL_CONCURRENCY_LIMITS
+            if concurrency_limits is None
+            else concurrency_limits
+        )
+        self.concurrency_groups = (
+            TOOL_CONCURRENCY_GROUPS
+            if concurrency_groups is None
+            else concurrency_groups
+        )
+        self.timeouts = TOOL_TIMEOUTS_SECONDS if timeouts is None else timeouts
+        self.default_timeout = default_timeout
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcp-db-tool"
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        group = self.concurrency_groups.get(tool_name, tool_name)
+        if group not in self._semaphores:
+            limit = self.concurrency_limits.get(group, self.max_workers)
+            self._semaphores[group] = asyncio.Semaphore(limit)
+        return self._semaphores[group]
+
+    async def run(
+        self, tool_name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Runs `func` on a worker thread under the limits configured for `tool_name`."""
+
+        timeout = self.timeouts.get(tool_name, self.default_timeout)
+        worker: dict[str, int] = {}
+
+        def _call() -> Any:
+            worker["thread_id"] = threading.get_ident()
+            return func(*args, **kwargs)
+
+        async def _limited_call() -> Any:
+            async with self._semaphore(tool_name):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, _call)
+
+        try:
+            return await asyncio.wait_for(_limited_call(), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if "thread_id" in worker:
+                get_db_pool().interrupt(worker["thread_id"])
+            if isinstance(e, asyncio.CancelledError):
+                logging.warning(f"Tool `{tool_name}` was cancelled.")
+                raise
+            logging.error(f"Tool `{tool_name}` timed out after `{timeout}s`.")
+            raise ToolTimeoutError(
+                f"Tool '{tool_name}' timed out after {timeout} seconds."
+            ) from None
+
+    def offload(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wraps a blocking function as a coroutine function that runs on this executor.
+
+        The wrapper keeps the wrapped function's name, docstring and signature, so
+        ADK `FunctionTool` builds the same declaration for it.
+        """
+
+        @functools.wraps(func)
+        async def _offloaded(*args, **kwargs) -> Any:
+            return await self.run(func.__name__, func, *args, **kwargs)
+
+        return _offloaded
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logging.info("Tool executor shut down.")
@@ -0,0 +1,96 @@
+"""Benchmark: session load time as the event history grows, before and after compaction.
+
+Usage:
+    python bench_compaction.py [--sizes 1000,10000,100000] [--keep 200]
+
+Creates one session per size in a throwaway DatabaseSessionService database,
+fills it with copies of a real appended event, then times a full
+`get_session`, the compaction, and `get_session` again on the compacted tail.
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import DatabaseSessionService
+from google.genai import types
+
+from session_compaction import compact_session
+
+APP_NAME = "bench_app"
+USER_ID = "bench_user"
+
+
+def _fill_events(db_path: str, session_id: str, count: int) -> None:
+    # Copies the one real event with new ids and one millisecond apart
+    with sqlite3.connect(db_path) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(events)")]
+        copied = ", ".join(
+            {
+                "id": "printf('bench-%d', n)",
+                "timestamp": "strftime('%Y-%m-%d %H:%M:%f', timestamp, printf('+%d.%03d seconds', n / 1000, n % 1000))",
+            }.get(column, column)
+            for column in columns
+        )
+        conn.execute(
+            f"""
+            INSERT INTO events ({", ".join(columns)})
+            WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+            SELECT {copied} FROM events, seq WHERE events.session_id = ?
+            """,
+            (count - 1, session_id),
+        )
+
+
+async def _time_get_session(service, session_id: str):
+    start = time.perf_counter()
+    session = await service.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+    )
+    return time.perf_counter() - start, len(session.events)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--keep", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        service = DatabaseSessionService(db_url=f"sqlite:///{db_path}")
+
+        print(f"{'events':>8} {'load before s':>14} {'compact s':>10} {'load after s':>13} {'events left':>12}")
+        for size in (int(size) for size in args.sizes.split(",")):
+            session = await service.create_session(
+                app_name=APP_NAME, user_id=USER_ID, state={"user_name": "Bench"}
+            )
+            await service.append_event(
+                session,
+                Event(
+                    author="user",
+                    content=types.Content(
+                        role="user", parts=[types.Part(text="remind me to buy milk")]
+                    ),
+                    actions=EventActions(state_delta={"last_message": "buy milk"}),
+                ),
+            )
+            _fill_events(db_path, session.id, size)
+
+            before, loaded = await _time_get_session(service, session.id)
+            assert loaded == size, (loaded, size)
+            compacted = compact_session(
+                APP_NAME, USER_ID, session.id, keep_events=args.keep, db_path=db_path
+            )
+            after, left = await _time_get_session(service, session.id)
+            print(
+                f"{size:>8} {before:>14.3f} {compacted['seconds']:>10.3f} {after:>13.3f} {left:>12}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""Benchmark: reminder edit latency against the size of the reminder list.
+
+Usage:
+    python bench_reminders.py [--sizes 10,100,1000,10000] [--edits 200]
+
+Updates and deletes are timed both in the middle of the list and at its end,
+the position furthest from the start.
+
+Compares the reminder store with the old approach of keeping the list in
+session state, where every edit copies the list and stores all of it again,
+both as the session's state and as the event's state delta (emulated here
+with plain sqlite tables shaped like DatabaseSessionService's). Lookups by
+content compare `find_reminder`'s trigram index with a scan of the list.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from reminder_store import ReminderStore
+
+USER_ID = "bench_user"
+VERBS = ["Call", "Buy", "Book", "Pay", "Email", "Plan", "Fix", "Renew", "Water"]
+OBJECTS = ["the dentist", "milk", "flights", "rent", "the team", "meeting notes"]
+FIND_QUERIES = ["dentist", "pay dentist 4242", "dentst 4242"]
+
+
+class StateListReminders:
+    """The previous approach: the whole list is rewritten on every edit."""
+
+    def __init__(self, db_path: str) -> None:
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("CREATE TABLE sessions (id TEXT PRIMARY KEY, state TEXT)")
+        self.conn.execute("CREATE TABLE events (session_id TEXT, actions TEXT)")
+        self.conn.execute("INSERT INTO sessions VALUES (?, ?)", (USER_ID, "{}"))
+        self.conn.commit()
+        self.state = {"reminders": []}
+
+    def _save(self, reminders: list) -> None:
+        self.state["reminders"] = reminders
+        delta = json.dumps({"state_delta": {"reminders": reminders}})
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO events VALUES (?, ?)", (USER_ID, delta)
+            )
+            self.conn.execute(
+                "UPDATE sessions SET state = ? WHERE id = ?",
+                (json.dumps(self.state), USER_ID),
+            )
+
+    def add(self, text: str) -> None:
+        reminders = list(self.state["reminders"])
+        reminders.append(text)
+        self._save(reminders)
+
+    def update(self, index: int, text: str) -> None:
+        reminders = list(self.state["reminders"])
+        reminders[index - 1] = text
+        self._save(reminders)
+
+    def delete(self, index: int) -> None:
+        reminders = list(self.state["reminders"])
+        reminders.pop(index - 1)
+        self._save(reminders)
+
+    def find(self, query: str) -> list:
+        words = query.lower().split()
+        return [
+            index
+            for index, reminder in enumerate(self.state["reminders"], 1)
+            if all(word in reminder.lower() for word in words)
+        ][:5]
+
+
+def _median_us(fn, edits: int, untimed=None) -> float:
+    timings = []
+    for i in range(edits):
+        start = time.perf_counter()
+        fn(i)
+        timings.append((time.perf_counter() - start) * 1e6)
+        if untimed is not None:
+            untimed(i)
+    return statistics.median(timings)
+
+
+def _measure(name: str, add, update, delete, find, size: int, edits: int) -> None:
+    add_us = _median_us(lambda i: add(f"extra reminder {i}"), edits)
+    # Edits in the middle and at the end of the list, which now holds `last` items;
+    # each deleted last reminder is added back so the end stays at `last`
+    last = size + edits
+    update_us = _median_us(lambda i: update(size // 2, f"changed {i}"), edits)
+    update_last_us = _median_us(lambda i: update(last, f"changed {i}"), edits)
+    delete_last_us = _median_us(
+        lambda i: delete(last), edits, lambda i: add(f"re-added reminder {i}")
+    )
+    delete_us = _median_us(lambda i: delete(size // 2), edits)
+    find_us = [_median_us(lambda i: find(query), edits) for query in FIND_QUERIES]
+    print(
+        f"{size:>8} {name:>8} {add_us:>10.1f} {update_us:>10.1f} {delete_us:>10.1f}"
+        f" {update_last_us:>10.1f} {delete_last_us:>10.1f}"
+        + "".join(f" {us:>10.1f}" for us in find_us)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>8} {'approach':>8} {'add us':>10} {'update us':>10} {'delete us':>10}"
+        f" {'upd end us':>10} {'del end us':>10}"
+        + "".join(f" {'find ' + str(n + 1) + ' us':>10}" for n in range(len(FIND_QUERIES)))
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in (int(size) for size in args.sizes.split(",")):
+            texts = [
+                f"{VERBS[i % len(VERBS)]} {OBJECTS[i % len(OBJECTS)]} {i}"
+                for i in range(size)
+            ]
+
+            state = StateListReminders(os.path.join(tmp_dir, f"state_{size}.db"))
+            state._save(list(texts))
+            _measure(
+                "state",
+                state.add,
+                state.update,
+                state.delete,
+                state.find,
+                size,
+                args.edits,
+            )
+            state.conn.close()
+
+            store = ReminderStore(os.path.join(tmp_dir, f"store_{size}.db"))
+            store.add_many(USER_ID, texts)
+            # Build the search index first, so edits include keeping it up to date
+            store.find(USER_ID, FIND_QUERIES[0])
+            _measure(
+                "store",
+                lambda text: store.add(USER_ID, text),
+                lambda index, text: store.update(USER_ID, index, text),
+                lambda index: store.delete(USER_ID, index),
+                lambda query: store.find(USER_ID, query),
+                size,
+                args.edits,
+            )
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
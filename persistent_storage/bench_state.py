@@ -0,0 +1,75 @@
+"""Benchmark: state snapshot load time as the event history grows.
+
+Usage:
+    python bench_state.py [--sizes 1000,10000,100000] [--loads 20]
+
+Creates one session per size in a throwaway DatabaseSessionService database,
+fills it with copies of a real appended event, then times the median
+`load_state_snapshot` without and with the events index that main.py creates
+at startup.
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import DatabaseSessionService
+from google.genai import types
+
+from bench_compaction import APP_NAME, USER_ID, _fill_events
+from utils import create_events_index, load_state_snapshot
+
+
+async def _median_load_ms(service, session_id: str, loads: int) -> float:
+    timings = []
+    for _ in range(loads):
+        start = time.perf_counter()
+        state = await load_state_snapshot(service, APP_NAME, USER_ID, session_id)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert state["user_name"] == "Bench", state
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--loads", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        service = DatabaseSessionService(db_url=f"sqlite:///{db_path}")
+
+        print(f"{'events':>8} {'no index ms':>12} {'index ms':>10}")
+        for size in (int(size) for size in args.sizes.split(",")):
+            session = await service.create_session(
+                app_name=APP_NAME, user_id=USER_ID, state={"user_name": "Bench"}
+            )
+            await service.append_event(
+                session,
+                Event(
+                    author="user",
+                    content=types.Content(
+                        role="user", parts=[types.Part(text="remind me to buy milk")]
+                    ),
+                    actions=EventActions(state_delta={"last_message": "buy milk"}),
+                ),
+            )
+            _fill_events(db_path, session.id, size)
+
+            without_index = await _median_load_ms(service, session.id, args.loads)
+            create_events_index(db_path)
+            with_index = await _median_load_ms(service, session.id, args.loads)
+            # Each size starts from an unindexed table
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("DROP INDEX idx_events_session_timestamp")
+            print(f"{size:>8} {without_index:>12.2f} {with_index:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
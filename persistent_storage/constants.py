@@ -1,5 +1,34 @@
 # Agent Database URL
-DB_URL: str = "sqlite:///./agent_data.db"
+DB_PATH: str = "./agent_data.db"
+DB_URL: str = f"sqlite:///{DB_PATH}"
+
+# Reminders are stored as rows in the same database file
+REMINDERS_DB_PATH: str = DB_PATH
+
+# Session compaction: once a session has more than the threshold of events, all
+# but the newest ones are archived; a threshold of 0 disables compaction
+COMPACTION_THRESHOLD_EVENTS: int = 400
+COMPACTION_KEEP_EVENTS: int = 200
+COMPACTION_ARCHIVE: bool = True
+
+# Last session id per user, so startup can skip the session lookup; "" disables it
+SESSION_CACHE_PATH: str = "./.last_session.json"
+
+# Reminders in the prompt: "full" injects the whole list every turn, "budgeted"
+# injects the count and the most relevant, then most recent, reminders that fit
+# in the token cap and points the model to the tools for the rest
+REMINDER_CONTEXT_MODE: str = "budgeted"
+REMINDER_CONTEXT_MAX_TOKENS: int = 300
+REMINDER_CONTEXT_MAX_REMINDERS: int = 20
+VIEW_REMINDERS_PAGE_SIZE: int = 50
+
+# Stream the response to the terminal while it is generated; buffered text is
+# written at line ends or at most every STREAM_FLUSH_INTERVAL seconds
+STREAM_RESPONSES: bool = True
+STREAM_FLUSH_INTERVAL: float = 0.05
+
+# Print the time to first token and the total time of every turn
+DEBUG_TIMING: bool = False
 
 # Application name
 APP_NAME: str = "Memory Agent"
@@ -1,37 +1,37 @@
 import asyncio
+from collections import Counter
 from dotenv import load_dotenv
 
 from google.adk import Runner
+from google.adk.events import Event, EventActions
 from google.adk.sessions import DatabaseSessionService
 
 from constants import DB_URL, APP_NAME, USER_ID, REMINDERS
 from memory_agent.agent import get_memory_agent
-from utils import call_agent_async
+from reminder_store import REMINDER_STORE
+from session_compaction import maybe_compact_session
+from session_resolver import forget_session_id, remember_session_id, resolve_session_id
+from utils import STATE_SNAPSHOT_CONFIG, call_agent_async, create_events_index
 
 load_dotenv()
 
 # Using SQLITE Database for persistent storage
 SESSION_SERVICE = DatabaseSessionService(db_url=DB_URL)
+create_events_index()
 
 INITIAL_STATE = {
     "user_name": "Rahul Dey",
-    REMINDERS: [],
 }
 
 async def get_session_id() -> str:
-    """Fetch existing session for user id, if exists return the first one else create new one
+    """Fetch the user's most recent session, if none exists create a new one
 
     Return:
         session_id(str): Session id
     """
-    # Checking for existing sessions for this user
-    existing_sessions = await SESSION_SERVICE.list_sessions(
-        app_name=APP_NAME,
-        user_id=USER_ID
-    )
-
-    if existing_sessions and len(existing_sessions.sessions) > 0:
-        session_id = existing_sessions.sessions[0].id
+    # Cached id first, else one indexed lookup of the latest session
+    session_id = resolve_session_id(APP_NAME, USER_ID)
+    if session_id:
         print(f"Continuing with existing session: {session_id}")
         return session_id
 
@@ -40,12 +40,59 @@ async def get_session_id() -> str:
         user_id=USER_ID,
         state=INITIAL_STATE,
     )
+    remember_session_id(APP_NAME, USER_ID, new_session.id)
     print(f"Created new session: {new_session.id}")
     return new_session.id
 
 
+async def migrate_state_reminders(session_id: str) -> bool:
+    """Copy reminders kept in session state by older versions into the reminder store.
+
+    Return:
+        bool: False if the session does not exist
+    """
+    session = await SESSION_SERVICE.get_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=session_id,
+        config=STATE_SNAPSHOT_CONFIG,
+    )
+    if session is None:
+        return False
+
+    state_reminders = session.state.get(REMINDERS, [])
+    if not state_reminders:
+        return True
+
+    # Another session may have been migrated already: only its missing reminders
+    # are added, so reminders shared by both sessions are not duplicated
+    stored = Counter(REMINDER_STORE.texts(USER_ID))
+    missing = []
+    for reminder in state_reminders:
+        if stored[reminder] > 0:
+            stored[reminder] -= 1
+        else:
+            missing.append(reminder)
+    if missing:
+        REMINDER_STORE.add_many(USER_ID, missing)
+        print(f"Moved {len(missing)} reminders from session state to the reminder store.")
+
+    # Clear the old list so it is never imported a second time
+    await SESSION_SERVICE.append_event(
+        session,
+        Event(author="system", actions=EventActions(state_delta={REMINDERS: []})),
+    )
+    return True
+
+
 async def main() -> None:
     session_id = await get_session_id()
+    if not await migrate_state_reminders(session_id):
+        # The cached session was deleted since it was cached
+        forget_session_id(APP_NAME, USER_ID)
+        session_id = await get_session_id()
+        await migrate_state_reminders(session_id)
+    maybe_compact_session(APP_NAME, USER_ID, session_id)
     memory_agent = get_memory_agent()
 
     # Create a runner with the memory agent
@@ -72,6 +119,9 @@ async def main() -> None:
         # Process the user query through the agent
         await call_agent_async(runner, USER_ID, session_id, user_input)
 
+        # Keep the history the runner reloads every turn at a bounded size
+        maybe_compact_session(APP_NAME, USER_ID, session_id)
+
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
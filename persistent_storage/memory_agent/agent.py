@@ -1,25 +1,118 @@
 from google.adk import Agent
+from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.models.lite_llm import LiteLlm
 
+from constants import (
+    REMINDER_CONTEXT_MAX_REMINDERS,
+    REMINDER_CONTEXT_MAX_TOKENS,
+    REMINDER_CONTEXT_MODE,
+)
 from memory_agent.tools.view_reminders_tool import view_reminders
 from memory_agent.tools.add_reminder_tool import add_reminder
 from memory_agent.tools.update_reminder_tool import update_reminder
 from memory_agent.tools.delete_reminder_tool import delete_reminder
+from memory_agent.tools.find_reminder_tool import find_reminder
 from memory_agent.tools.update_user_name_tool import update_user_name
 from memory_agent.prompt import MEMORY_AGENT_PROMPT
+from reminder_store import REMINDER_STORE
 
 MODEL = LiteLlm(model="ollama_chat/qwen3:1.7b")
 
 
-def get_memory_agent() -> Agent:
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text
+    return len(text) // 4 + 1
+
+
+def _user_message(context: ReadonlyContext) -> str:
+    content = context.user_content
+    if not content or not content.parts:
+        return ""
+    return " ".join(part.text for part in content.parts if part.text)
+
+
+def budgeted_reminders(
+    user_id: str, message: str, max_tokens: int, max_reminders: int
+) -> str:
+    """Describe the user's reminders within `max_tokens` estimated tokens.
+
+    Reminders sharing words with the user's message come first, then the newest
+    ones, up to `max_reminders` lines, plus a pointer to the tools for the rest.
+    """
+    count = REMINDER_STORE.count(user_id)
+    if count == 0:
+        return "No reminders yet."
+
+    header = (
+        f"{count} reminders in total. Shown as 'index. text', the ones related to "
+        "this message first, then the newest:"
+    )
+    footer = (
+        "Use find_reminder to look up any other reminder by its content, "
+        "or view_reminders(page) to list them all."
+    )
+    budget = max_tokens - estimate_tokens(header) - estimate_tokens(footer)
+
+    lines, shown_ids = [], set()
+    candidates = REMINDER_STORE.related(user_id, message, max_reminders)
+    candidates += REMINDER_STORE.recent(user_id, max_reminders)
+    for reminder in candidates:
+        if len(lines) == max_reminders:
+            break
+        if reminder["id"] in shown_ids:
+            continue
+        line = f"{reminder['index']}. {reminder['text']}"
+        if estimate_tokens(line) > budget:
+            break
+        budget -= estimate_tokens(line)
+        shown_ids.add(reminder["id"])
+        lines.append(line)
+
+    if len(lines) == count:
+        footer = ""
+    return "\n".join([header, *lines, footer]).strip()
+
+
+def build_instruction(
+    context_mode: str = REMINDER_CONTEXT_MODE,
+    max_tokens: int = REMINDER_CONTEXT_MAX_TOKENS,
+    max_reminders: int = REMINDER_CONTEXT_MAX_REMINDERS,
+):
+    """Build the instruction provider that fills the prompt for every model call."""
+
+    def memory_agent_instruction(context: ReadonlyContext) -> str:
+        user_id = context._invocation_context.user_id
+        if context_mode == "full":
+            reminders = REMINDER_STORE.texts(user_id)
+        else:
+            reminders = budgeted_reminders(
+                user_id, _user_message(context), max_tokens, max_reminders
+            )
+        instruction = MEMORY_AGENT_PROMPT.format(
+            user_name=context.state.get("user_name", ""), reminders=reminders
+        )
+        print(
+            f"--- Prompt: {context_mode} reminders ~{estimate_tokens(str(reminders))} tokens, instruction ~{estimate_tokens(instruction)} tokens ---"
+        )
+        return instruction
+
+    return memory_agent_instruction
+
+
+def get_memory_agent(
+    context_mode: str = REMINDER_CONTEXT_MODE,
+    max_tokens: int = REMINDER_CONTEXT_MAX_TOKENS,
+    max_reminders: int = REMINDER_CONTEXT_MAX_REMINDERS,
+) -> Agent:
     return Agent(
         name="memory_agent",
         description="A start reminder agent with persistent memory",
         model=MODEL,
-        instruction=MEMORY_AGENT_PROMPT,
+        instruction=build_instruction(context_mode, max_tokens, max_reminders),
         tools=[
             add_reminder,
             view_reminders,
+            find_reminder,
             update_reminder,
             delete_reminder,
             update_user_name,
@@ -21,8 +21,8 @@ MEMORY_AGENT_PROMPT: str = """
     
     1. When the user asks to update or delete a reminder but doesn't provide an index:
        - If they mention the content of the reminder (e.g., "delete my meeting reminder"), 
-         look through the reminders to find a match
-       - If you find an exact or close match, use that index
+         call the find_reminder tool with those words (e.g., find_reminder("meeting"))
+       - Use the index of the first match it returns
        - Never clarify which reminder the user is referring to, just use the first match
        - If no match is found, list all reminders and ask the user to specify
     
@@ -38,6 +38,7 @@ MEMORY_AGENT_PROMPT: str = """
     
     4. For viewing:
        - Always use the view_reminders tool when the user asks to see their reminders
+       - It returns one page at a time: pass page=1 first, then page=2, 3, ... when the user asks for more
        - Format the response in a numbered list for clarity
        - If there are no reminders, suggest adding some
     
@@ -1,8 +1,8 @@
-from typing import Dict, List
+from typing import Dict
 
 from google.adk.tools import ToolContext
 
-from constants import REMINDERS
+from reminder_store import REMINDER_STORE
 
 
 def add_reminder(reminder: str, tool_context: ToolContext) -> Dict:
@@ -18,14 +18,12 @@ def add_reminder(reminder: str, tool_context: ToolContext) -> Dict:
     """
     print(f"============== Tool: add_reminder called for '{reminder}' ==============")
 
-    # Get current reminders from state
-    reminders: List = tool_context.state.get(REMINDERS, [])
-
-    reminders.append(reminder)
-    tool_context.state[REMINDERS] = reminders
+    # Store the reminder as its own row instead of rewriting the list in state
+    added = REMINDER_STORE.add(tool_context._invocation_context.user_id, reminder)
 
     return {
         "action": "add_reminder",
+        "id": added["id"],
         "reminder": reminder,
         "message": f"Added reminder: {reminder}",
-    }
\ No newline at end of file
+    }
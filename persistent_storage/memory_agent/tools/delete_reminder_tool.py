@@ -2,6 +2,8 @@ from typing import Dict
 
 from google.adk.tools import ToolContext
 
+from reminder_store import REMINDER_STORE
+
 def delete_reminder(index: int, tool_context: ToolContext) -> Dict:
     """Delete a reminder.
 
@@ -14,26 +16,25 @@ def delete_reminder(index: int, tool_context: ToolContext) -> Dict:
     """
     print(f"--- Tool: delete_reminder called for index {index} ---")
 
-    # Get current reminders from state
-    reminders = tool_context.state.get("reminders", [])
+    user_id = tool_context._invocation_context.user_id
+
+    # Remove only the reminder's own row from the store
+    deleted = REMINDER_STORE.delete(user_id, index)
 
-    # Check if the index is valid
-    if not reminders or index < 1 or index > len(reminders):
+    # Check if the index was valid
+    if deleted is None:
         return {
             "action": "delete_reminder",
             "status": "error",
-            "message": f"Could not find reminder at position {index}. Currently there are {len(reminders)} reminders.",
+            "message": f"Could not find reminder at position {index}. Currently there are {REMINDER_STORE.count(user_id)} reminders.",
         }
 
-    # Remove the reminder (adjusting for 0-based indices)
-    deleted_reminder = reminders.pop(index - 1)
-
-    # Update state with the modified list
-    tool_context.state["reminders"] = reminders
+    deleted_reminder = deleted["text"]
 
     return {
         "action": "delete_reminder",
         "index": index,
+        "id": deleted["id"],
         "deleted_reminder": deleted_reminder,
         "message": f"Deleted reminder {index}: '{deleted_reminder}'",
-    }
\ No newline at end of file
+    }
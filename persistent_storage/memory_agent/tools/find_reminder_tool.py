@@ -0,0 +1,41 @@
+import time
+from typing import Dict
+
+from google.adk.tools import ToolContext
+
+from reminder_store import REMINDER_STORE
+
+
+def find_reminder(query: str, tool_context: ToolContext) -> Dict:
+    """Find the user's reminders that best match a description.
+
+    Args:
+        query: Words from the reminder the user is referring to (e.g., "meeting")
+        tool_context: Context for accessing session state
+
+    Returns:
+        The best matches, best first, each with its 1-based index and text
+    """
+    start = time.perf_counter()
+    matches = REMINDER_STORE.find(tool_context._invocation_context.user_id, query)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"--- Tool: find_reminder called for '{query}', {len(matches)} matches in {elapsed_ms:.3f} ms ---"
+    )
+
+    if not matches:
+        return {
+            "action": "find_reminder",
+            "status": "error",
+            "message": f"No reminder matches '{query}'.",
+        }
+
+    return {
+        "action": "find_reminder",
+        "query": query,
+        "matches": [
+            {"index": match["index"], "reminder": match["text"], "score": match["score"]}
+            for match in matches
+        ],
+        "message": f"Best match is reminder {matches[0]['index']}: '{matches[0]['text']}'",
+    }
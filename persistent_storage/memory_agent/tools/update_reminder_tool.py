@@ -2,6 +2,8 @@ from typing import Dict
 
 from google.adk.tools import ToolContext
 
+from reminder_store import REMINDER_STORE
+
 
 def update_reminder(index: int, updated_text: str, tool_context: ToolContext) -> Dict:
     """Update an existing reminder.
@@ -18,27 +20,25 @@ def update_reminder(index: int, updated_text: str, tool_context: ToolContext) ->
         f"--- Tool: update_reminder called for index {index} with '{updated_text}' ---"
     )
 
-    # Get current reminders from state
-    reminders = tool_context.state.get("reminders", [])
+    user_id = tool_context._invocation_context.user_id
+
+    # Update only the reminder's own row in the store
+    old = REMINDER_STORE.update(user_id, index, updated_text)
 
-    # Check if the index is valid
-    if not reminders or index < 1 or index > len(reminders):
+    # Check if the index was valid
+    if old is None:
         return {
             "action": "update_reminder",
             "status": "error",
-            "message": f"Could not find reminder at position {index}. Currently there are {len(reminders)} reminders.",
+            "message": f"Could not find reminder at position {index}. Currently there are {REMINDER_STORE.count(user_id)} reminders.",
         }
 
-    # Update the reminder (adjusting for 0-based indices)
-    old_reminder = reminders[index - 1]
-    reminders[index - 1] = updated_text
-
-    # Update state with the modified list
-    tool_context.state["reminders"] = reminders
+    old_reminder = old["text"]
 
     return {
         "action": "update_reminder",
         "index": index,
+        "id": old["id"],
         "old_text": old_reminder,
         "updated_text": updated_text,
         "message": f"Updated reminder {index} from '{old_reminder}' to '{updated_text}'",
@@ -2,26 +2,39 @@ from typing import List, Dict
 
 from google.adk.tools import ToolContext
 
-from constants import REMINDERS
+from constants import VIEW_REMINDERS_PAGE_SIZE
+from reminder_store import REMINDER_STORE
 
 
-def view_reminders(tool_context: ToolContext) -> Dict:
+def view_reminders(page: int, tool_context: ToolContext) -> Dict:
     """
-    View all current reminders.
+    View the current reminders, one page at a time.
 
     Args:
+        page(int): The 1-based page of reminders to show, 1 unless the user asks for more
         tool_context(ToolContext): Context for accessing session state
 
     Returns:
-        The list of reminders
+        The reminders on that page, the index of the first one and the page count
     """
-    print(f"============== Tool: view_reminders called ==============")
+    print(f"============== Tool: view_reminders called for page {page} ==============")
 
-    # Get current reminders from state
-    reminders: List = tool_context.state.get(REMINDERS, [])
+    # The model may leave the page out or pass 0 when it means the first page
+    if not page or page < 1:
+        page = 1
+
+    user_id = tool_context._invocation_context.user_id
+
+    # Get one page of reminders from the reminder store
+    rows = REMINDER_STORE.page(user_id, page, VIEW_REMINDERS_PAGE_SIZE)
+    reminders: List = [row["text"] for row in rows]
+    count = REMINDER_STORE.count(user_id)
 
     return {
         "action": "view_reminders",
         "reminders": reminders,
-        "count": len(reminders),
-    }
\ No newline at end of file
+        "first_index": rows[0]["index"] if rows else None,
+        "page": page,
+        "total_pages": -(-count // VIEW_REMINDERS_PAGE_SIZE),
+        "count": count,
+    }
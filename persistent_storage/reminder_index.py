@@ -0,0 +1,179 @@
+import bisect
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Matches sharing fewer of the query's trigrams than this are not returned
+MIN_MATCH_SCORE: float = 0.4
+
+
+def _words(text: str) -> Set[str]:
+    return set(_WORD_PATTERN.findall(text.lower()))
+
+
+def _trigrams(words: Iterable[str]) -> Set[str]:
+    # Words are padded so short words and word starts get trigrams of their own
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class _UserReminderIndex:
+    __slots__ = ("ids", "texts", "words", "trigrams")
+
+    def __init__(self) -> None:
+        self.ids: List[int] = []
+        self.texts: Dict[int, str] = {}
+        self.words: Dict[str, Set[int]] = defaultdict(set)
+        self.trigrams: Dict[str, Set[int]] = defaultdict(set)
+
+    def add(self, reminder_id: int, text: str) -> None:
+        if reminder_id in self.texts:
+            self.remove(reminder_id)
+        bisect.insort(self.ids, reminder_id)
+        self.texts[reminder_id] = text
+        words = _words(text)
+        for word in words:
+            self.words[word].add(reminder_id)
+        for gram in _trigrams(words):
+            self.trigrams[gram].add(reminder_id)
+
+    def remove(self, reminder_id: int) -> None:
+        text = self.texts.pop(reminder_id, None)
+        if text is None:
+            return
+        del self.ids[bisect.bisect_left(self.ids, reminder_id)]
+        words = _words(text)
+        for postings, keys in ((self.words, words), (self.trigrams, _trigrams(words))):
+            for key in keys:
+                posting = postings.get(key)
+                if posting is not None:
+                    posting.discard(reminder_id)
+                    if not posting:
+                        del postings[key]
+
+
+class ReminderIndex:
+    """In-memory word and trigram index over each user's reminders.
+
+    Built from the store the first time a user is searched or edited and then
+    kept up to date incrementally by every add, update and delete. Reminders
+    containing every query word are found by intersecting word postings; only
+    when there are none are reminders ranked by the query trigrams they share,
+    which also matches partial and misspelled words.
+    """
+
+    def __init__(self) -> None:
+        self._users: Dict[str, _UserReminderIndex] = {}
+
+    def is_loaded(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    def load(self, user_id: str, reminders: List[Dict]) -> None:
+        index = _UserReminderIndex()
+        for reminder in reminders:
+            index.add(reminder["id"], reminder["text"])
+        self._users[user_id] = index
+
+    def invalidate(self, user_id: str) -> None:
+        self._users.pop(user_id, None)
+
+    def id_at(self, user_id: str, position: int) -> Optional[int]:
+        """Returns the id of the reminder at the 1-based `position`, if there is one."""
+        index = self._users.get(user_id)
+        if index is None or not 1 <= position <= len(index.ids):
+            return None
+        return index.ids[position - 1]
+
+    def add(self, user_id: str, reminder_id: int, text: str) -> None:
+        # Users that were never searched or edited are indexed when they first are
+        index = self._users.get(user_id)
+        if index is not None:
+            index.add(reminder_id, text)
+
+    def remove(self, user_id: str, reminder_id: int) -> None:
+        index = self._users.get(user_id)
+        if index is not None:
+            index.remove(reminder_id)
+
+    def related(self, user_id: str, text: str, limit: int) -> List[Dict]:
+        """Rank reminders by how many of the longer words of `text` they contain.
+
+        Returns:
+            Up to `limit` reminders sharing at least one word, best first, each
+            with the reminder's 1-based index, id and text
+        """
+        index = self._users.get(user_id)
+        if index is None:
+            return []
+        # Short words ("my", "the", "to") would relate almost every reminder
+        shared = Counter()
+        for word in _words(text):
+            if len(word) >= 4:
+                shared.update(index.words.get(word, ()))
+        return [
+            {
+                "index": bisect.bisect_left(index.ids, reminder_id) + 1,
+                "id": reminder_id,
+                "text": index.texts[reminder_id],
+            }
+            for reminder_id, _ in heapq.nlargest(
+                limit, shared.items(), key=lambda item: (item[1], item[0])
+            )
+        ]
+
+    def search(self, user_id: str, query: str, limit: int = 5) -> List[Dict]:
+        """Rank the user's reminders by how well they match `query`.
+
+        Returns:
+            Up to `limit` matches, best first, each with the reminder's 1-based
+            index, id, text and score between 0 and 1
+        """
+        index = self._users.get(user_id)
+        query_words = _words(query)
+        if index is None or not query_words:
+            return []
+
+        # Reminders with every query word: newest first
+        exact = set.intersection(
+            *(index.words.get(word, set()) for word in query_words)
+        )
+        if exact:
+            ranked = [(1.0, reminder_id) for reminder_id in heapq.nlargest(limit, exact)]
+        else:
+            query_grams = _trigrams(query_words)
+            postings = sorted(
+                (index.trigrams.get(gram, set()) for gram in query_grams), key=len
+            )
+            min_shared = MIN_MATCH_SCORE * len(query_grams)
+            # A match shares at least `min_shared` grams, so it is in at least one
+            # of the postings left after dropping the `min_shared - 1` largest
+            candidates = set().union(
+                *postings[: len(postings) - math.ceil(min_shared) + 1]
+            )
+            shared = Counter()
+            for posting in postings:
+                shared.update(candidates.intersection(posting))
+            ranked = [
+                (count / len(query_grams), reminder_id)
+                for reminder_id, count in heapq.nlargest(
+                    limit, shared.items(), key=lambda item: (item[1], item[0])
+                )
+                if count >= min_shared
+            ]
+
+        return [
+            {
+                "index": bisect.bisect_left(index.ids, reminder_id) + 1,
+                "id": reminder_id,
+                "text": index.texts[reminder_id],
+                "score": round(score, 3),
+            }
+            for score, reminder_id in ranked
+        ]
@@ -0,0 +1,173 @@
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from constants import REMINDERS_DB_PATH
+from reminder_index import ReminderIndex
+
+
+class ReminderStore:
+    """Reminders kept as one row each, keyed by user.
+
+    Adding, updating or deleting a reminder writes only its own row, so nothing
+    is serialized or stored again for the rest of the list. Ids are stable; the
+    1-based positions the tools work with follow insertion order and are
+    resolved to ids through the in-memory ReminderIndex.
+    """
+
+    def __init__(self, db_path: str = REMINDERS_DB_PATH) -> None:
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._index = ReminderIndex()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS user_reminders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    text TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_user_reminders_user_id "
+                "ON user_reminders (user_id, id)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _row_at(self, conn: sqlite3.Connection, user_id: str, index: int):
+        # The position is resolved to an id in memory, so the row is read by its
+        # key however far down the list it is
+        self._load_index_locked(user_id)
+        reminder_id = self._index.id_at(user_id, index)
+        if reminder_id is None:
+            return None
+        return conn.execute(
+            "SELECT id, text FROM user_reminders WHERE user_id = ? AND id = ?",
+            (user_id, reminder_id),
+        ).fetchone()
+
+    def add(self, user_id: str, text: str) -> Dict:
+        with self._lock, self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO user_reminders (user_id, text) VALUES (?, ?)",
+                (user_id, text),
+            )
+            self._index.add(user_id, cursor.lastrowid, text)
+            return {"id": cursor.lastrowid, "text": text}
+
+    def add_many(self, user_id: str, texts: List[str]) -> int:
+        with self._lock, self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO user_reminders (user_id, text) VALUES (?, ?)",
+                ((user_id, text) for text in texts),
+            )
+            self._index.invalidate(user_id)
+            return len(texts)
+
+    def update(self, user_id: str, index: int, text: str) -> Optional[Dict]:
+        """Replaces the text of the reminder at the 1-based `index`; returns the old row."""
+        with self._lock, self._connection() as conn:
+            row = self._row_at(conn, user_id, index)
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE user_reminders SET text = ? WHERE id = ?", (text, row["id"])
+            )
+            self._index.add(user_id, row["id"], text)
+            return {"id": row["id"], "text": row["text"]}
+
+    def delete(self, user_id: str, index: int) -> Optional[Dict]:
+        """Deletes the reminder at the 1-based `index`; returns the deleted row."""
+        with self._lock, self._connection() as conn:
+            row = self._row_at(conn, user_id, index)
+            if row is None:
+                return None
+            conn.execute("DELETE FROM user_reminders WHERE id = ?", (row["id"],))
+            self._index.remove(user_id, row["id"])
+            return {"id": row["id"], "text": row["text"]}
+
+    def _list_locked(self, user_id: str) -> List[Dict]:
+        rows = self._connection().execute(
+            "SELECT id, text FROM user_reminders WHERE user_id = ? ORDER BY id",
+            (user_id,),
+        )
+        return [dict(row) for row in rows]
+
+    def list(self, user_id: str) -> List[Dict]:
+        with self._lock:
+            return self._list_locked(user_id)
+
+    def page(self, user_id: str, page: int, page_size: int) -> List[Dict]:
+        """Returns the reminders of the 1-based `page`, each with its 1-based index."""
+        offset = (max(page, 1) - 1) * page_size
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, text FROM user_reminders WHERE user_id = ? "
+                "ORDER BY id LIMIT ? OFFSET ?",
+                (user_id, page_size, offset),
+            )
+            return [
+                {"index": offset + position, **dict(row)}
+                for position, row in enumerate(rows, 1)
+            ]
+
+    def recent(self, user_id: str, limit: int) -> List[Dict]:
+        """Returns the `limit` newest reminders, newest first, with their 1-based indices."""
+        with self._lock:
+            conn = self._connection()
+            count = conn.execute(
+                "SELECT COUNT(*) FROM user_reminders WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+            rows = conn.execute(
+                "SELECT id, text FROM user_reminders WHERE user_id = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (user_id, limit),
+            )
+            return [
+                {"index": count - position, **dict(row)}
+                for position, row in enumerate(rows)
+            ]
+
+    def _load_index_locked(self, user_id: str) -> None:
+        if not self._index.is_loaded(user_id):
+            self._index.load(user_id, self._list_locked(user_id))
+
+    def find(self, user_id: str, query: str, limit: int = 5) -> List[Dict]:
+        """Returns the reminders best matching `query`, with their 1-based indices."""
+        with self._lock:
+            self._load_index_locked(user_id)
+            return self._index.search(user_id, query, limit)
+
+    def related(self, user_id: str, text: str, limit: int) -> List[Dict]:
+        """Returns the reminders sharing the most words with `text`, e.g. a user message."""
+        with self._lock:
+            self._load_index_locked(user_id)
+            return self._index.related(user_id, text, limit)
+
+    def texts(self, user_id: str) -> List[str]:
+        return [reminder["text"] for reminder in self.list(user_id)]
+
+    def count(self, user_id: str) -> int:
+        with self._lock:
+            return self._connection().execute(
+                "SELECT COUNT(*) FROM user_reminders WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+REMINDER_STORE = ReminderStore()
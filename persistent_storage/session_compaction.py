@@ -0,0 +1,124 @@
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict
+
+from constants import (
+    COMPACTION_ARCHIVE,
+    COMPACTION_KEEP_EVENTS,
+    COMPACTION_THRESHOLD_EVENTS,
+    DB_PATH,
+)
+from utils import EVENTS_INDEX
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute(EVENTS_INDEX)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS session_snapshots (
+            app_name TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            compacted_at REAL NOT NULL,
+            events_compacted INTEGER NOT NULL,
+            state TEXT
+        )
+        """
+    )
+    return conn
+
+
+def count_session_events(
+    app_name: str, user_id: str, session_id: str, db_path: str = DB_PATH
+) -> int:
+    with closing(_connect(db_path)) as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?",
+            (app_name, user_id, session_id),
+        ).fetchone()[0]
+
+
+def compact_session(
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    keep_events: int = COMPACTION_KEEP_EVENTS,
+    archive: bool = COMPACTION_ARCHIVE,
+    db_path: str = DB_PATH,
+) -> Dict:
+    """Fold all but the newest `keep_events` events of a session into a snapshot.
+
+    The session's state already holds the result of every event's state delta,
+    so the old events are only history. Their state is recorded in
+    `session_snapshots`, they are moved to `events_archive` (or dropped when
+    `archive` is False) and only the tail is left for `get_session` to load.
+
+    Returns:
+        A summary with the number of events compacted and kept
+    """
+    start = time.perf_counter()
+    conn = _connect(db_path)
+    try:
+        session_key = (app_name, user_id, session_id)
+        cutoff = conn.execute(
+            "SELECT timestamp FROM events "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ? "
+            "ORDER BY timestamp DESC LIMIT 1 OFFSET ?",
+            (*session_key, keep_events),
+        ).fetchone()
+        if cutoff is None:
+            return {"events_compacted": 0, "events_kept": None, "seconds": 0.0}
+
+        # Events at or before the newest event beyond the tail are compacted
+        old_events = (
+            "FROM events WHERE app_name = ? AND user_id = ? AND session_id = ? "
+            "AND timestamp <= ?"
+        )
+        old_events_params = (*session_key, cutoff[0])
+        with conn:
+            if archive:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS events_archive AS SELECT * FROM events WHERE 0"
+                )
+                conn.execute(
+                    f"INSERT INTO events_archive SELECT * {old_events}",
+                    old_events_params,
+                )
+            compacted = conn.execute(
+                f"DELETE {old_events}", old_events_params
+            ).rowcount
+            conn.execute(
+                "INSERT INTO session_snapshots "
+                "SELECT app_name, user_id, id, ?, ?, state FROM sessions "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                (time.time(), compacted, *session_key),
+            )
+    finally:
+        conn.close()
+
+    seconds = time.perf_counter() - start
+    print(
+        f"Compacted {compacted} old events of session {session_id} in {seconds:.2f}s, kept the newest {keep_events}."
+    )
+    return {"events_compacted": compacted, "events_kept": keep_events, "seconds": seconds}
+
+
+def maybe_compact_session(
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    threshold: int = COMPACTION_THRESHOLD_EVENTS,
+    keep_events: int = COMPACTION_KEEP_EVENTS,
+    db_path: str = DB_PATH,
+) -> Dict:
+    """Compact the session once it has more than `threshold` events; 0 disables it."""
+    if threshold <= 0:
+        return {"events_compacted": 0}
+    if count_session_events(app_name, user_id, session_id, db_path) <= threshold:
+        return {"events_compacted": 0}
+    return compact_session(
+        app_name, user_id, session_id, keep_events=keep_events, db_path=db_path
+    )
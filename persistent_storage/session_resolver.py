@@ -0,0 +1,98 @@
+import json
+import os
+import sqlite3
+from contextlib import closing
+from typing import Optional
+
+from constants import DB_PATH, SESSION_CACHE_PATH
+
+# Lets the latest session of a user be found without reading all of their sessions
+SESSIONS_INDEX: str = (
+    "CREATE INDEX IF NOT EXISTS idx_sessions_app_user_update_time "
+    "ON sessions (app_name, user_id, update_time)"
+)
+
+
+def _cache_key(app_name: str, user_id: str) -> str:
+    return f"{app_name}/{user_id}"
+
+
+def _read_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_path: str, cache: dict) -> None:
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as cache_file:
+        json.dump(cache, cache_file)
+    os.replace(temp_path, cache_path)
+
+
+def cached_session_id(
+    app_name: str, user_id: str, cache_path: str = SESSION_CACHE_PATH
+) -> Optional[str]:
+    if not cache_path:
+        return None
+    return _read_cache(cache_path).get(_cache_key(app_name, user_id))
+
+
+def remember_session_id(
+    app_name: str, user_id: str, session_id: str, cache_path: str = SESSION_CACHE_PATH
+) -> None:
+    """Save the session id locally so the next startup does not query for it."""
+    if not cache_path:
+        return
+    cache = _read_cache(cache_path)
+    cache[_cache_key(app_name, user_id)] = session_id
+    _write_cache(cache_path, cache)
+
+
+def forget_session_id(
+    app_name: str, user_id: str, cache_path: str = SESSION_CACHE_PATH
+) -> None:
+    """Drop a cached session id that no longer points to a session."""
+    if not cache_path:
+        return
+    cache = _read_cache(cache_path)
+    if cache.pop(_cache_key(app_name, user_id), None) is not None:
+        _write_cache(cache_path, cache)
+
+
+def latest_session_id(
+    app_name: str, user_id: str, db_path: str = DB_PATH
+) -> Optional[str]:
+    """Look up the user's most recently updated session through the index."""
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute(SESSIONS_INDEX)
+        row = conn.execute(
+            # update_time has one-second resolution; rowid breaks ties by creation order
+            "SELECT id FROM sessions WHERE app_name = ? AND user_id = ? "
+            "ORDER BY update_time DESC, rowid DESC LIMIT 1",
+            (app_name, user_id),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def resolve_session_id(
+    app_name: str,
+    user_id: str,
+    db_path: str = DB_PATH,
+    cache_path: str = SESSION_CACHE_PATH,
+) -> Optional[str]:
+    """Return the session to continue: the cached one, else the latest in the database.
+
+    Returns:
+        The session id, or None if the user has no session yet
+    """
+    session_id = cached_session_id(app_name, user_id, cache_path)
+    if session_id:
+        return session_id
+
+    session_id = latest_session_id(app_name, user_id, db_path)
+    if session_id:
+        remember_session_id(app_name, user_id, session_id, cache_path)
+    return session_id
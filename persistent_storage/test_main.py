@@ -0,0 +1,81 @@
+"""Run with: python -m unittest test_main (from persistent_storage)."""
+
+import os
+import tempfile
+import unittest
+
+from google.adk.sessions import InMemorySessionService
+
+from constants import APP_NAME, REMINDERS, USER_ID
+from reminder_store import ReminderStore
+
+_tmp_dir = tempfile.TemporaryDirectory()
+_cwd = os.getcwd()
+# main opens ./agent_data.db on import, so it is imported from a throwaway directory
+os.chdir(_tmp_dir.name)
+try:
+    import main
+finally:
+    os.chdir(_cwd)
+
+
+def tearDownModule() -> None:
+    _tmp_dir.cleanup()
+
+
+class MigrateStateRemindersTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.store = ReminderStore(os.path.join(_tmp_dir.name, f"{self.id()}.db"))
+        self.session_service = InMemorySessionService()
+        self._saved = (main.REMINDER_STORE, main.SESSION_SERVICE)
+        main.REMINDER_STORE = self.store
+        main.SESSION_SERVICE = self.session_service
+
+    async def asyncTearDown(self) -> None:
+        main.REMINDER_STORE, main.SESSION_SERVICE = self._saved
+        self.store.close()
+
+    async def _session_with_reminders(self, reminders: list) -> str:
+        session = await self.session_service.create_session(
+            app_name=APP_NAME, user_id=USER_ID, state={REMINDERS: reminders}
+        )
+        return session.id
+
+    async def _state_reminders(self, session_id: str) -> list:
+        session = await self.session_service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        return session.state.get(REMINDERS, [])
+
+    async def test_empty_store_imports_every_reminder(self) -> None:
+        session_id = await self._session_with_reminders(["Buy milk", "Call mom"])
+
+        self.assertTrue(await main.migrate_state_reminders(session_id))
+
+        self.assertEqual(self.store.texts(USER_ID), ["Buy milk", "Call mom"])
+        self.assertEqual(await self._state_reminders(session_id), [])
+
+    async def test_non_empty_store_imports_missing_reminders(self) -> None:
+        # A second pre-migration session, resumed after the first was migrated
+        self.store.add_many(USER_ID, ["Buy milk", "Call mom"])
+        session_id = await self._session_with_reminders(
+            ["Call mom", "Pay rent", "Pay rent"]
+        )
+
+        self.assertTrue(await main.migrate_state_reminders(session_id))
+
+        self.assertEqual(
+            self.store.texts(USER_ID), ["Buy milk", "Call mom", "Pay rent", "Pay rent"]
+        )
+        self.assertEqual(await self._state_reminders(session_id), [])
+
+        # The cleared list is not imported a second time
+        self.assertTrue(await main.migrate_state_reminders(session_id))
+        self.assertEqual(self.store.count(USER_ID), 4)
+
+    async def test_missing_session(self) -> None:
+        self.assertFalse(await main.migrate_state_reminders("no-such-session"))
+
+
+if __name__ == "__main__":
+    unittest.main()
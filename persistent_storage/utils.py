@@ -1,6 +1,15 @@
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from typing import List
+
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.sessions.base_session_service import GetSessionConfig
 from google.genai import types
 
-from constants import REMINDERS
+from constants import DB_PATH, DEBUG_TIMING, STREAM_FLUSH_INTERVAL, STREAM_RESPONSES
+from reminder_store import REMINDER_STORE
 
 
 # ANSI color codes for terminal output
@@ -30,24 +39,114 @@ class Colors:
     BG_WHITE = "\033[47m"
 
 
+RESPONSE_HEADER = f"{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╔══ AGENT RESPONSE ═════════════════════════════════════════{Colors.RESET}"
+RESPONSE_FOOTER = f"{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╚═════════════════════════════════════════════════════════════{Colors.RESET}"
+
+
+def event_text(event) -> str:
+    """The answer text of an event, without the model's thoughts."""
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(
+        part.text for part in event.content.parts if part.text and not part.thought
+    )
+
+
+class ResponseStream:
+    """Renders response text as it is streamed, in the same box as a full response.
+
+    Chunks arrive a few tokens at a time, so they are buffered and written to
+    the terminal at line ends or once `flush_interval` seconds have passed
+    since the last write, instead of with one write and flush per chunk.
+    """
+
+    def __init__(self, out=None, flush_interval: float = STREAM_FLUSH_INTERVAL):
+        self._out = out or sys.stdout
+        self._flush_interval = flush_interval
+        self._buffer: List[str] = []
+        # The first chunk is written at once, so it shows as soon as it arrives
+        self._last_flush = 0.0
+        self.is_open = False
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if not self.is_open:
+            self._buffer.append(f"\n{RESPONSE_HEADER}\n{Colors.CYAN}{Colors.BOLD}")
+            self.is_open = True
+        self._buffer.append(text)
+        if "\n" in text or time.perf_counter() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._out.write("".join(self._buffer))
+            self._buffer.clear()
+        self._out.flush()
+        self._last_flush = time.perf_counter()
+
+    def close(self) -> bool:
+        """End the streamed response.
+
+        Returns:
+            True if response text was streamed since the last close
+        """
+        if not self.is_open:
+            return False
+        self._buffer.append(f"{Colors.RESET}\n{RESPONSE_FOOTER}\n\n")
+        self.flush()
+        self.is_open = False
+        return True
+
+
+# Only the newest event is loaded: the state is stored with the session row,
+# so reading it does not need the rest of the event history
+STATE_SNAPSHOT_CONFIG = GetSessionConfig(num_recent_events=1)
+
+# Lets get_session find a session's newest events without scanning every event
+EVENTS_INDEX: str = (
+    "CREATE INDEX IF NOT EXISTS idx_events_session_timestamp "
+    "ON events (app_name, user_id, session_id, timestamp)"
+)
+
+
+def create_events_index(db_path: str = DB_PATH) -> None:
+    """Index the session service's events so snapshot reads do not sort them all."""
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute(EVENTS_INDEX)
+
+
+async def load_state_snapshot(session_service, app_name, user_id, session_id) -> dict:
+    """Load the session state without loading the whole event history."""
+    session = await session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        config=STATE_SNAPSHOT_CONFIG,
+    )
+    return dict(session.state) if session else {}
+
+
 async def display_state(
     session_service, app_name, user_id, session_id, label="Current State"
 ):
     """Display the current session state in a formatted way."""
     try:
-        session = await session_service.get_session(
-            app_name=app_name, user_id=user_id, session_id=session_id
+        start = time.perf_counter()
+        state = await load_state_snapshot(
+            session_service, app_name, user_id, session_id
         )
+        reminders = REMINDER_STORE.texts(user_id)
+        load_ms = (time.perf_counter() - start) * 1000
 
         # Format the output with clear sections
         print(f"\n{'-' * 10} {label} {'-' * 10}")
 
         # Handle the username
-        user_name = session.state.get("user_name", "Unknown")
+        user_name = state.get("user_name", "Unknown")
         print(f"👤 User: {user_name}")
 
         # Handle reminders
-        reminders = session.state.get(REMINDERS, [])
         if reminders:
             print("📝 Reminders:")
             for idx, reminder in enumerate(reminders, 1):
@@ -55,13 +154,24 @@ async def display_state(
         else:
             print("📝 Reminders: None")
 
+        print(f"⏱️ State loaded in {load_ms:.1f} ms")
         print("-" * (22 + len(label)))
     except Exception as e:
         print(f"Error displaying state: {e}")
 
 
-async def process_agent_response(event):
-    """Process and display agent response events."""
+async def process_agent_response(event, stream=None):
+    """Process and display agent response events.
+
+    With a `stream`, partial events are rendered through it as they arrive and
+    the complete event that follows them is logged without repeating the text.
+    """
+    if event.partial:
+        if stream is not None:
+            stream.write(event_text(event))
+        return None
+    streamed = stream.close() if stream is not None else False
+
     # Log basic event info
     print(f"Event ID: {event.id}, Author: {event.author}")
 
@@ -89,6 +199,13 @@ async def process_agent_response(event):
             elif hasattr(part, "text") and part.text and not part.text.isspace():
                 print(f"  Text: '{part.text.strip()}'")
 
+    # Token usage of the model call that produced this event
+    usage = getattr(event, "usage_metadata", None)
+    if usage and usage.prompt_token_count:
+        print(
+            f"  Tokens: prompt {usage.prompt_token_count}, response {usage.candidates_token_count or 0}"
+        )
+
     # Check for final response after specific parts
     final_response = None
     if event.is_final_response():
@@ -100,13 +217,10 @@ async def process_agent_response(event):
         ):
             final_response = event.content.parts[0].text.strip()
             # Use colors and formatting to make the final response stand out
-            print(
-                f"\n{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╔══ AGENT RESPONSE ═════════════════════════════════════════{Colors.RESET}"
-            )
-            print(f"{Colors.CYAN}{Colors.BOLD}{final_response}{Colors.RESET}")
-            print(
-                f"{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╚═════════════════════════════════════════════════════════════{Colors.RESET}\n"
-            )
+            if not streamed:
+                print(f"\n{RESPONSE_HEADER}")
+                print(f"{Colors.CYAN}{Colors.BOLD}{final_response}{Colors.RESET}")
+                print(f"{RESPONSE_FOOTER}\n")
         else:
             print(
                 f"\n{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD}==> Final Agent Response: [No text content in final event]{Colors.RESET}\n"
@@ -115,8 +229,20 @@ async def process_agent_response(event):
     return final_response
 
 
-async def call_agent_async(runner, user_id, session_id, query):
-    """Call the agent asynchronously with the user's query."""
+async def call_agent_async(
+    runner,
+    user_id,
+    session_id,
+    query,
+    streaming: bool = STREAM_RESPONSES,
+    debug: bool = DEBUG_TIMING,
+):
+    """Call the agent asynchronously with the user's query.
+
+    With `streaming`, the model is called in SSE mode and the response is shown
+    while it is generated; with `debug`, the time to first token and the total
+    time of the turn are printed.
+    """
     content = types.Content(role="user", parts=[types.Part(text=query)])
     print(
         f"\n{Colors.BG_GREEN}{Colors.BLACK}{Colors.BOLD}--- Running Query: {query} ---{Colors.RESET}"
@@ -132,16 +258,41 @@ async def call_agent_async(runner, user_id, session_id, query):
         "State BEFORE processing",
     )
 
+    run_config = RunConfig(
+        streaming_mode=StreamingMode.SSE if streaming else StreamingMode.NONE
+    )
+    stream = ResponseStream() if streaming else None
+    start = time.perf_counter()
+    first_token_time = None
     try:
         async for event in runner.run_async(
-            user_id=user_id, session_id=session_id, new_message=content
+            user_id=user_id,
+            session_id=session_id,
+            new_message=content,
+            run_config=run_config,
         ):
+            if first_token_time is None and event_text(event):
+                first_token_time = time.perf_counter()
             # Process each event and get the final response if available
-            response = await process_agent_response(event)
+            response = await process_agent_response(event, stream)
             if response:
                 final_response_text = response
     except Exception as e:
         print(f"Error during agent call: {e}")
+    finally:
+        if stream is not None:
+            stream.close()
+    total_ms = (time.perf_counter() - start) * 1000
+
+    if debug:
+        mode = "streaming" if streaming else "not streaming"
+        if first_token_time is None:
+            print(f"⏱️ No response text, total {total_ms:.0f} ms ({mode})")
+        else:
+            first_token_ms = (first_token_time - start) * 1000
+            print(
+                f"⏱️ First token in {first_token_ms:.0f} ms, total {total_ms:.0f} ms ({mode})"
+            )
 
     # Display state after processing the message
     await display_state(